@@ -1,14 +1,24 @@
 import streamlit as st
 import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
 import os
+import time
 import requests
+from requests.adapters import HTTPAdapter
 from datetime import datetime, timedelta, date, time as dt_time, timezone
-from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from itertools import groupby
+from typing import TYPE_CHECKING
 from zoneinfo import ZoneInfo
 from dotenv import load_dotenv
 from supabase import create_client
+from urllib3.util.retry import Retry
+
+if TYPE_CHECKING:
+    import plotly.graph_objects as go
 
 
 # How long cached Supabase reads stay fresh (in seconds). The data only
@@ -17,6 +27,73 @@ from supabase import create_client
 # filters / time windows.
 CACHE_TTL_SECONDS = 300
 
+# Above this many people the ranking chart switches from one SVG bar per
+# person to a single WebGL marker trace, which stays responsive in the
+# browser for large teams.
+RANKING_WEBGL_THRESHOLD = 50
+
+# How long a Gmail access check result is remembered (in seconds). A domain
+# that isn't connected to the service account stays that way until someone
+# changes the Workspace admin settings, so re-probing it for every user added
+# in the same session just burns a round-trip to Google.
+GMAIL_CHECK_TTL_SECONDS = 600
+
+# Timezones offered in the Manage tab, plus a position lookup so the edit
+# form can preselect a user's current zone without scanning the list.
+TIMEZONE_OPTIONS = [
+    "America/New_York", "America/Chicago", "America/Denver",
+    "America/Los_Angeles", "America/Phoenix", "Europe/London",
+    "Europe/Paris", "Asia/Kolkata", "Asia/Tokyo", "Asia/Shanghai", "UTC"
+]
+TIMEZONE_INDEX = {tz: i for i, tz in enumerate(TIMEZONE_OPTIONS)}
+
+# Max OOO rows sent per insert request from the Manage tab, so a large paste
+# stays well inside PostgREST's request size limits.
+OOO_INSERT_BATCH_SIZE = 100
+
+# Display labels for the response pairs editor's visible columns; the
+# remaining columns keep their names for the exclude/restore handlers.
+PAIR_DISPLAY_NAMES = {
+    'external_sender': 'External Sender',
+    'subject': 'Subject',
+    'received_at': 'Received',
+    'replied_at': 'Replied',
+    'response_time': 'Response Time',
+    'body_preview': 'Email Preview',
+}
+
+# Preset time windows: (days back for start_date, days back for end_date)
+TIME_WINDOWS = {
+    'Yesterday': (1, 1),
+    'Last 7 Days (Week)': (7, 0),
+    'Last 14 Days (Sprint)': (14, 0),
+    'Last 30 Days (Month)': (30, 0),
+    'Last 90 Days (Quarter)': (90, 0),
+}
+
+# Sidebar "About This Data" text, keyed by use_adjusted. Filled in with
+# str.format(days=..., range_label=..., filter_note=...).
+ABOUT_DATA_TEMPLATES = {
+    True: """
+**Data from the last {days} days** ({range_label}) — **Working Hours Adjusted**
+
+Response times count full 24-hour days but **exclude weekends** (if configured for the user's timezone) and **out-of-office days**. On the day an email is received, time counts from when it arrived to end of day. On the reply day, time counts from start of day to when the reply was sent.
+
+*Example: An email received Friday at 4 PM with a reply Monday at 10 AM would show ~18 hours (8 hrs Friday + 10 hrs Monday), skipping Saturday and Sunday. If a user is marked as OOO for an entire week, none of those days count toward their response time.*
+
+This shows email threads between **external senders** and the tracked user. Internal emails (same domain) and automated messages are excluded.{filter_note}
+""",
+    False: """
+**Data from the last {days} days** ({range_label}) — **Raw Time**
+
+Response times are calculated as total elapsed time between receiving an email and sending a reply, including nights, weekends, holidays, and out-of-office days. OOO time is **not** excluded in this mode — switch to **Working Hours Adjusted** to account for OOO periods.
+
+*Example: An email received Friday at 4 PM with a reply Monday at 10 AM would show ~66 hours.*
+
+This shows email threads between **external senders** and the tracked user. Internal emails (same domain) and automated messages are excluded.{filter_note}
+""",
+}
+
 
 def _clear_data_caches():
     """
@@ -28,46 +105,56 @@ def _clear_data_caches():
         st.cache_data.clear()
     except Exception:
         pass
+    # Also drop this session's copy of the stats frame (see tab_dashboard)
+    st.session_state.pop("stats_memo", None)
 
-def exclude_response_pair(pair_data: dict):
-    """Insert a response pair into the excluded_response_pairs table."""
+def exclude_response_pairs(pairs: list):
+    """Insert response pairs into the excluded_response_pairs table in one request."""
+    if not pairs:
+        return
     supabase = get_supabase()
     supabase.table("excluded_response_pairs").upsert(
-        pair_data, on_conflict="thread_id,replied_at"
+        pairs, on_conflict="thread_id,replied_at"
     ).execute()
 
-def restore_response_pair(excluded_id: str):
-    """Remove a pair from excluded_response_pairs by its id."""
+def restore_response_pairs(excluded_ids: list):
+    """Remove pairs from excluded_response_pairs by id in one request."""
+    if not excluded_ids:
+        return
     supabase = get_supabase()
-    supabase.table("excluded_response_pairs").delete().eq("id", excluded_id).execute()
+    supabase.table("excluded_response_pairs").delete().in_("id", excluded_ids).execute()
 
 @st.cache_data(ttl=CACHE_TTL_SECONDS, show_spinner=False)
 def get_excluded_pairs(user_email: str = None) -> list:
     """Fetch excluded pairs, optionally filtered by user."""
     supabase = get_supabase()
-    query = supabase.table("excluded_response_pairs").select("*")
+    query = supabase.table("excluded_response_pairs").select("id, thread_id, replied_at")
     if user_email:
         query = query.eq("user_email", user_email)
     result = query.order("excluded_at", desc=True).execute()
     return result.data if result.data else []
 
-def whitelist_response_pair(pair_data: dict):
-    """Add a response pair to the whitelist (override >7d filter)."""
+def whitelist_response_pairs(pairs: list):
+    """Add response pairs to the whitelist (override >7d filter) in one request."""
+    if not pairs:
+        return
     supabase = get_supabase()
     supabase.table("whitelisted_response_pairs").upsert(
-        pair_data, on_conflict="thread_id,replied_at"
+        pairs, on_conflict="thread_id,replied_at"
     ).execute()
 
-def remove_whitelisted_pair(whitelist_id: str):
-    """Remove a pair from the whitelist by its id."""
+def remove_whitelisted_pairs(whitelist_ids: list):
+    """Remove pairs from the whitelist by id in one request."""
+    if not whitelist_ids:
+        return
     supabase = get_supabase()
-    supabase.table("whitelisted_response_pairs").delete().eq("id", whitelist_id).execute()
+    supabase.table("whitelisted_response_pairs").delete().in_("id", whitelist_ids).execute()
 
 @st.cache_data(ttl=CACHE_TTL_SECONDS, show_spinner=False)
 def get_whitelisted_pairs(user_email: str = None) -> list:
     """Fetch whitelisted pairs, optionally filtered by user."""
     supabase = get_supabase()
-    query = supabase.table("whitelisted_response_pairs").select("*")
+    query = supabase.table("whitelisted_response_pairs").select("id, thread_id, replied_at")
     if user_email:
         query = query.eq("user_email", user_email)
     result = query.execute()
@@ -76,6 +163,28 @@ def get_whitelisted_pairs(user_email: str = None) -> list:
 def recalculate_daily_stats(user_email: str, dates: list):
     """Recalculate daily_stats for specific user+dates after exclusion/restoration."""
     supabase = get_supabase()
+
+    # One round-trip for every date: the recalc_daily_stats RPC recomputes
+    # the metrics in Postgres (migrations/create_recalc_daily_stats_function.sql).
+    try:
+        supabase.rpc("recalc_daily_stats", {
+            "target_email": user_email,
+            "target_dates": list(dates),
+        }).execute()
+        return
+    except Exception:
+        pass  # Function doesn't exist yet, recalculate each date client-side
+
+    # The user's exclusions don't change between dates, so fetch them once
+    # rather than once per date.
+    excluded_result = supabase.table("excluded_response_pairs").select(
+        "thread_id, replied_at"
+    ).eq("user_email", user_email).execute()
+    excluded_keys = {
+        (ep["thread_id"], _norm_ts(ep["replied_at"]))
+        for ep in excluded_result.data or []
+    }
+
     for date_str in dates:
         pairs_result = supabase.table("response_pairs").select(
             "response_hours, thread_id, replied_at"
@@ -83,24 +192,6 @@ def recalculate_daily_stats(user_email: str, dates: list):
             "replied_at", date_str + "T00:00:00"
         ).lte("replied_at", date_str + "T23:59:59").execute()
 
-        excluded_result = supabase.table("excluded_response_pairs").select(
-            "thread_id, replied_at"
-        ).eq("user_email", user_email).execute()
-
-        def _norm_ts(ts):
-            try:
-                dt = datetime.fromisoformat(str(ts))
-                if dt.tzinfo is None:
-                    dt = dt.replace(tzinfo=timezone.utc)
-                return dt.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S")
-            except Exception:
-                return str(ts)
-
-        excluded_keys = set()
-        if excluded_result.data:
-            for ep in excluded_result.data:
-                excluded_keys.add((ep["thread_id"], _norm_ts(ep["replied_at"])))
-
         hours_list = []
         if pairs_result.data:
             for p in pairs_result.data:
@@ -113,13 +204,11 @@ def recalculate_daily_stats(user_email: str, dates: list):
         }
 
         if hours_list:
-            sorted_hours = sorted(hours_list)
-            n = len(sorted_hours)
-            median = sorted_hours[n // 2] if n % 2 == 1 else (sorted_hours[n//2 - 1] + sorted_hours[n//2]) / 2
-            stats_update["avg_response_hours"] = round(sum(hours_list) / n, 2)
-            stats_update["median_response_hours"] = round(median, 2)
-            stats_update["min_response_hours"] = round(min(hours_list), 2)
-            stats_update["max_response_hours"] = round(max(hours_list), 2)
+            hours_arr = np.asarray(hours_list, dtype=float)
+            stats_update["avg_response_hours"] = round(float(hours_arr.mean()), 2)
+            stats_update["median_response_hours"] = round(float(np.median(hours_arr)), 2)
+            stats_update["min_response_hours"] = round(float(hours_arr.min()), 2)
+            stats_update["max_response_hours"] = round(float(hours_arr.max()), 2)
         else:
             stats_update["avg_response_hours"] = None
             stats_update["median_response_hours"] = None
@@ -145,15 +234,58 @@ def get_supabase():
     )
 
 
+# Shared worker pool for issuing independent Supabase reads concurrently.
+# The calls are network-bound, so threads overlap the round-trips.
+@st.cache_resource
+def get_executor() -> ThreadPoolExecutor:
+    return ThreadPoolExecutor(max_workers=8, thread_name_prefix="supabase")
+
+
+# Remembered Gmail access results: "user@domain" -> expiry for verified
+# users, "@domain" -> expiry for domains that aren't connected. Transient
+# errors are never stored, so they're retried on the next attempt.
+@st.cache_resource
+def _gmail_access_memo() -> dict[str, float]:
+    return {}
+
+
+# The service-account key is read and parsed once per process; each user
+# gets a delegated copy via with_subject.
+@st.cache_resource
+def _gmail_service_account(credentials_file: str):
+    from google.oauth2 import service_account
+
+    return service_account.Credentials.from_service_account_file(
+        credentials_file,
+        scopes=["https://www.googleapis.com/auth/gmail.readonly"]
+    )
+
+
+# Built Gmail clients per user, so a repeat check skips building the client
+# again and reuses the delegated credentials' access token until it expires.
+# Failed builds raise and aren't cached.
+@st.cache_resource(max_entries=100)
+def _gmail_service(credentials_file: str, user_email: str):
+    from googleapiclient.discovery import build
+
+    credentials = _gmail_service_account(credentials_file).with_subject(user_email)
+    return build("gmail", "v1", credentials=credentials, cache_discovery=False)
+
+
 def check_gmail_access(user_email: str) -> tuple[bool, str]:
     """
     Check if we have Gmail API access for a user.
     Returns (success, message).
     """
-    try:
-        from google.oauth2 import service_account
-        from googleapiclient.discovery import build
+    domain = user_email.split("@")[1] if "@" in user_email else "unknown"
+    memo = _gmail_access_memo()
+    now = time.monotonic()
+    if memo.get(f"@{domain}", 0) > now:
+        return False, f"domain_not_connected:{domain}"
+    if memo.get(user_email, 0) > now:
+        return True, "Access verified"
 
+    try:
         credentials_file = os.getenv("GOOGLE_CREDENTIALS_FILE", "credentials.json")
 
         # If credentials file doesn't exist (e.g., on Streamlit Cloud), skip the check
@@ -161,22 +293,18 @@ def check_gmail_access(user_email: str) -> tuple[bool, str]:
         if not os.path.exists(credentials_file):
             return True, "Skipped (no local credentials)"
 
-        credentials = service_account.Credentials.from_service_account_file(
-            credentials_file,
-            scopes=["https://www.googleapis.com/auth/gmail.readonly"]
-        ).with_subject(user_email)
+        service = _gmail_service(credentials_file, user_email)
 
-        service = build("gmail", "v1", credentials=credentials)
-
-        # Try to list 1 thread to verify access
-        service.users().threads().list(userId="me", maxResults=1).execute()
+        # getProfile is the smallest call that exercises the delegated token
+        service.users().getProfile(userId="me").execute()
 
+        memo[user_email] = now + GMAIL_CHECK_TTL_SECONDS
         return True, "Access verified"
 
     except Exception as e:
         error_msg = str(e)
         if "unauthorized_client" in error_msg.lower() or "access denied" in error_msg.lower():
-            domain = user_email.split("@")[1] if "@" in user_email else "unknown"
+            memo[f"@{domain}"] = now + GMAIL_CHECK_TTL_SECONDS
             return False, f"domain_not_connected:{domain}"
         elif "invalid_grant" in error_msg.lower() or "user not found" in error_msg.lower():
             return False, "user_not_found"
@@ -184,6 +312,22 @@ def check_gmail_access(user_email: str) -> tuple[bool, str]:
             return False, f"error:{error_msg}"
 
 
+# Pooled HTTP session for the GitHub API, so repeated workflow dispatches
+# (e.g. syncing several users in a row) reuse the keep-alive connection.
+# Failed connection attempts are retried with a short backoff; urllib3 never
+# re-sends a POST that reached the server, so a dispatch can't fire twice.
+@st.cache_resource
+def get_github_session() -> requests.Session:
+    session = requests.Session()
+    session.headers.update({"Accept": "application/vnd.github.v3+json"})
+    session.mount("https://", HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=8,
+        max_retries=Retry(total=2, backoff_factor=0.3),
+    ))
+    return session
+
+
 def trigger_github_workflow(user_email: str = "", backfill: bool = True) -> bool:
     """Trigger the GitHub Actions workflow to fetch email data."""
     github_token = os.getenv("GITHUB_TOKEN")
@@ -192,11 +336,6 @@ def trigger_github_workflow(user_email: str = "", backfill: bool = True) -> bool
 
     url = "https://api.github.com/repos/stephent-lumiere/lumiere-email-tracker/actions/workflows/daily-sync.yml/dispatches"
 
-    headers = {
-        "Authorization": f"token {github_token}",
-        "Accept": "application/vnd.github.v3+json"
-    }
-
     data = {
         "ref": "main",
         "inputs": {
@@ -206,7 +345,11 @@ def trigger_github_workflow(user_email: str = "", backfill: bool = True) -> bool
     }
 
     try:
-        response = requests.post(url, headers=headers, json=data)
+        # The token is sent per call rather than baked into the cached
+        # session, so rotating GITHUB_TOKEN takes effect without a restart.
+        response = get_github_session().post(
+            url, headers={"Authorization": f"token {github_token}"}, json=data, timeout=10
+        )
         if response.status_code == 204:
             return True, "Workflow triggered successfully"
         else:
@@ -214,6 +357,16 @@ def trigger_github_workflow(user_email: str = "", backfill: bool = True) -> bool
     except Exception as e:
         return False, f"Error: {str(e)}"
 
+@st.cache_data(ttl=CACHE_TTL_SECONDS, show_spinner=False)
+def get_user_ooo_periods(user_email: str) -> list:
+    """Fetch a user's OOO periods, newest first."""
+    supabase = get_supabase()
+    result = supabase.table("user_out_of_office").select(
+        "id, start_date, end_date, description"
+    ).eq("user_email", user_email).order("start_date", desc=True).execute()
+    return result.data or []
+
+
 @st.cache_data(ttl=CACHE_TTL_SECONDS, show_spinner=False)
 def get_user_ooo_dates(user_email: str) -> frozenset:
     """Fetch all OOO dates for a user as a frozenset of date objects.
@@ -222,12 +375,10 @@ def get_user_ooo_dates(user_email: str) -> frozenset:
     """
     ooo_dates = set()
     try:
-        supabase = get_supabase()
-        result = supabase.table("user_out_of_office").select(
-            "start_date, end_date"
-        ).eq("user_email", user_email).execute()
-        if result.data:
-            for row in result.data:
+        # Shares the cached period list with the Manage tab's OOO section
+        periods = get_user_ooo_periods(user_email)
+        if periods:
+            for row in periods:
                 start = datetime.fromisoformat(row["start_date"]).date()
                 end = datetime.fromisoformat(row["end_date"]).date()
                 current = start
@@ -259,6 +410,33 @@ def get_user_work_settings(user_email: str) -> dict:
     return default_settings
 
 
+@st.cache_data(ttl=CACHE_TTL_SECONDS, show_spinner=False)
+def get_tracked_users() -> list:
+    """Fetch all tracked users (active and inactive), ordered by domain then email.
+    Includes the work settings columns so every Manage section can share one fetch."""
+    supabase = get_supabase()
+    result = supabase.table("tracked_users").select(
+        "email, display_name, domain, is_active, team_function, timezone, exclude_weekends"
+    ).order("domain").order("email").execute()
+    return result.data if result.data else []
+
+
+@st.cache_data(ttl=CACHE_TTL_SECONDS, show_spinner=False)
+def get_tracked_users_by_domain() -> dict:
+    """Tracked users grouped by domain (falling back to the email's domain),
+    domains in sorted order and emails in order within each domain."""
+    def domain_key(user):
+        return user.get("domain") or user["email"].split("@")[1]
+
+    # The rows arrive ordered by domain, email; rows without a domain sort
+    # last server-side, so re-sort on the fallback key. The sort is stable,
+    # so email order within a domain is kept.
+    return {
+        domain: list(group)
+        for domain, group in groupby(sorted(get_tracked_users(), key=domain_key), key=domain_key)
+    }
+
+
 def calculate_adjusted_hours(
     received_at: datetime,
     replied_at: datetime,
@@ -325,6 +503,40 @@ def _calculate_adjusted_hours_cached(
     return total_seconds / 3600
 
 
+def _adjusted_hours_array(
+    user_emails: pd.Series,
+    received_at: pd.Series,
+    replied_at: pd.Series,
+    fallback_hours: pd.Series,
+    settings_by_email: dict,
+    ooo_by_email: dict,
+) -> np.ndarray:
+    """
+    Working-hours-adjusted response hours for aligned columns of pairs.
+    Timestamps are parsed in one vectorized pass (naive values are treated as
+    UTC) and the per-pair calendar math goes through the lru_cache'd helper;
+    pairs that can't be parsed or computed keep their fallback_hours value.
+    """
+    recv = pd.to_datetime(received_at, utc=True, errors="coerce", format="ISO8601").to_numpy(dtype=object)
+    repl = pd.to_datetime(replied_at, utc=True, errors="coerce", format="ISO8601").to_numpy(dtype=object)
+
+    adjusted = np.full(len(recv), np.nan)
+    for i, (email, r, p) in enumerate(zip(user_emails.to_numpy(), recv, repl)):
+        if pd.isna(r) or pd.isna(p):
+            continue
+        settings = settings_by_email[email]
+        try:
+            adjusted[i] = _calculate_adjusted_hours_cached(
+                r.to_pydatetime(), p.to_pydatetime(),
+                settings["timezone"], settings["exclude_weekends"], ooo_by_email[email],
+            )
+        except Exception:
+            pass  # Leave NaN so the fallback is used
+
+    fallback = pd.to_numeric(fallback_hours, errors="coerce").to_numpy(dtype=float)
+    return np.where(np.isnan(adjusted), fallback, adjusted)
+
+
 def _norm_ts(ts) -> str:
     """Normalize a timestamp string to UTC seconds precision for reliable comparison.
     Used as the canonical form for (thread_id, replied_at) exclusion/whitelist keys."""
@@ -337,34 +549,83 @@ def _norm_ts(ts) -> str:
         return str(ts)
 
 
-@st.cache_data(ttl=CACHE_TTL_SECONDS, show_spinner=False)
-def get_stats_from_supabase(start_date: date, end_date: date, use_adjusted: bool = False, exclude_long_responses: bool = True) -> pd.DataFrame:
+def _format_response_times(hours: pd.Series) -> np.ndarray:
     """
-    Fetch aggregated per-user stats from Supabase for the given date range.
+    Vectorized response-time labels: "45m" under an hour, "3h 15m" under a
+    day, "2d 4h" otherwise, and "" for missing values.
 
-    Caching: this is the heaviest read on the dashboard. Wrapping it with
-    @st.cache_data means changing the domain/team/individual filter is a
-    cache hit (no network round-trip), and only changing start_date /
-    end_date / use_adjusted / exclude_long_responses re-runs the queries.
+    Works on whole minutes: one float-to-int conversion, then integer
+    division/modulo for the parts, and each label is only formatted for the
+    rows that use it.
+    """
+    h = pd.to_numeric(hours, errors="coerce").to_numpy(dtype=float)
+    missing = np.isnan(h)
+    total_minutes = np.where(missing, 0.0, h * 60).astype(np.int64)
+
+    days, day_minutes = np.divmod(total_minutes, 1440)
+    hours_part, minutes_part = np.divmod(day_minutes, 60)
+
+    out = np.full(len(h), "", dtype=object)
+    under_hour = ~missing & (total_minutes < 60)
+    under_day = ~missing & (total_minutes >= 60) & (total_minutes < 1440)
+    over_day = ~missing & (total_minutes >= 1440)
+    out[under_hour] = np.char.mod("%dm", minutes_part[under_hour])
+    out[under_day] = np.char.add(
+        np.char.mod("%dh ", hours_part[under_day]), np.char.mod("%dm", minutes_part[under_day])
+    )
+    out[over_day] = np.char.add(
+        np.char.mod("%dd ", days[over_day]), np.char.mod("%dh", hours_part[over_day])
+    )
+    return out
 
-    Performance notes:
-    - response_pairs is paginated to handle Supabase's 1000-row default cap.
-    - excluded_response_pairs and whitelisted_response_pairs are filtered by
-      replied_at on the same date range so we don't full-scan those tables.
-    - All per-row filtering is done with vectorized pandas Series.isin (not
-      DataFrame.apply(axis=1)).
-    - When use_adjusted=True, calculate_adjusted_hours is memoized via
-      lru_cache so repeated (recv, repl, tz, exclude_weekends, ooo) tuples
-      only do the date-loop math once.
+
+def _format_display_timestamps(*columns: pd.Series) -> list:
+    """
+    Format timestamp columns as "Mon DD, HH:MM" display strings ("" when
+    missing). All columns are parsed in one to_datetime call with an explicit
+    ISO8601 format (no per-value format inference) and cache=True, so repeated
+    timestamps are only parsed once.
+    """
+    stacked = pd.concat(columns, ignore_index=True)
+    formatted = pd.to_datetime(
+        stacked, utc=True, format="ISO8601", cache=True
+    ).dt.strftime('%b %d, %H:%M').fillna("")
+
+    out = []
+    start = 0
+    for col in columns:
+        values = formatted.iloc[start:start + len(col)]
+        out.append(pd.Series(values.to_numpy(), index=col.index))
+        start += len(col)
+    return out
+
+
+def _fetch_daily_totals(supabase, start_date: date, end_date: date) -> pd.DataFrame:
+    """
+    Per-user sums of emails_received / emails_sent / response_pairs_count over
+    the date range. Uses the daily_stats_agg RPC (see
+    migrations/create_daily_stats_agg_function.sql) so Postgres does the
+    GROUP BY and joins the tracked_users profile columns (domain,
+    display_name, team_function); falls back to aggregating daily_stats rows
+    client-side, without the profile columns, if the function hasn't been
+    created yet.
     """
-    import time
+    try:
+        result = supabase.rpc("daily_stats_agg", {
+            "start_date": start_date.isoformat(),
+            "end_date": end_date.isoformat(),
+        }).execute()
+        return pd.DataFrame(result.data or [])
+    except Exception:
+        pass  # Function doesn't exist yet - aggregate client-side below
 
     # Retry logic for transient network errors
     result = None
     for attempt in range(3):
         try:
-            supabase = get_supabase()
-            result = supabase.table("daily_stats").select("*").gte(
+            result = supabase.table("daily_stats").select(
+                "user_email, emails_received, emails_sent, response_pairs_count"
+            ).gte(
                 "date", start_date.isoformat()
             ).lte(
                 "date", end_date.isoformat()
@@ -379,14 +640,48 @@ def get_stats_from_supabase(start_date: date, end_date: date, use_adjusted: bool
     if not result or not result.data:
         return pd.DataFrame()
 
-    df = pd.DataFrame(result.data)
+    # Columnar group-by in Arrow instead of building a pandas frame of every
+    # daily row first; only the per-user result is converted to pandas.
+    # Arrow emits groups in first-seen order, so sort by email to match the
+    # RPC (and pandas groupby) ordering.
+    table = pa.Table.from_pylist(result.data)
+    zero_if_null = pc.ScalarAggregateOptions(min_count=0)  # match pandas: all-null sums to 0
+    totals = table.group_by("user_email").aggregate([
+        ("emails_received", "sum", zero_if_null),
+        ("emails_sent", "sum", zero_if_null),
+        ("response_pairs_count", "sum", zero_if_null),
+    ]).sort_by("user_email")
+    return totals.rename_columns([
+        name.removesuffix("_sum") for name in totals.column_names
+    ]).to_pandas()
 
-    # Aggregate email counts by user (these sums are correct from daily_stats).
-    aggregated = df.groupby("user_email").agg({
-        "emails_received": "sum",
-        "emails_sent": "sum",
-        "response_pairs_count": "sum",
-    }).reset_index()
+
+PAIR_STATS_COLUMNS = ["user_email", "avg_response_hours", "median_response_hours"]
+
+
+def _fetch_pair_stats(supabase, start_date: date, end_date: date, use_adjusted: bool, exclude_long_responses: bool) -> pd.DataFrame:
+    """
+    Per-user mean and median response hours over the date range, after
+    dropping excluded pairs and (optionally) un-whitelisted pairs over 120h.
+    Returns PAIR_STATS_COLUMNS.
+
+    Raw hours use the response_pair_stats RPC (see
+    migrations/create_response_pair_stats_function.sql), so filtering and
+    percentile_cont run in Postgres and one row per user comes back. Adjusted
+    hours depend on the current OOO/work settings, so those - and raw hours
+    when the function hasn't been created yet - are computed client-side from
+    paginated response_pairs.
+    """
+    if not use_adjusted:
+        try:
+            result = supabase.rpc("response_pair_stats", {
+                "start_date": start_date.isoformat(),
+                "end_date": end_date.isoformat(),
+                "exclude_long": exclude_long_responses,
+            }).execute()
+            return pd.DataFrame(result.data or [], columns=PAIR_STATS_COLUMNS)
+        except Exception:
+            pass  # Function doesn't exist yet - compute client-side below
 
     # Pull raw response_pairs so we can compute true mean/median (per-day
     # medians can't be combined into a true per-user median). We always fetch
@@ -396,89 +691,85 @@ def get_stats_from_supabase(start_date: date, end_date: date, use_adjusted: bool
         # Without received_at, the bytes-on-the-wire shrinks meaningfully.
         select_cols = "user_email, thread_id, replied_at, response_hours"
 
-    all_pairs_data = []
+    # One count request sizes the pagination (Supabase caps responses at
+    # 1000 rows), then every page is fetched concurrently on the shared
+    # executor instead of one round-trip after another. Pages are ordered by
+    # id so the ranges don't overlap or skip rows.
     batch_size = 1000
-    offset = 0
+
+    def range_query(source, columns, **select_kwargs):
+        return supabase.table(source).select(
+            columns, **select_kwargs
+        ).gte(
+            "replied_at", start_date.isoformat()
+        ).lte(
+            "replied_at", end_date.isoformat() + "T23:59:59"
+        )
+
+    # The response_pairs_included view (migrations/create_response_pairs_included_view.sql)
+    # drops excluded pairs in Postgres, so they're never transferred; without
+    # it, read the table and filter exclusions client-side below.
+    source = "response_pairs_included"
     try:
-        while True:
-            pairs_batch = supabase.table("response_pairs").select(
-                select_cols
-            ).gte(
-                "replied_at", start_date.isoformat()
-            ).lte(
-                "replied_at", end_date.isoformat() + "T23:59:59"
-            ).range(offset, offset + batch_size - 1).execute()
-
-            if not pairs_batch.data:
-                break
-            all_pairs_data.extend(pairs_batch.data)
-            if len(pairs_batch.data) < batch_size:
-                break
-            offset += batch_size
+        try:
+            total = range_query(source, "id", count="exact", head=True).execute().count or 0
+        except Exception:
+            source = "response_pairs"  # View doesn't exist yet
+            total = range_query(source, "id", count="exact", head=True).execute().count or 0
+
+        # Each page becomes its own DataFrame as it arrives, so there's no
+        # combined list of row dicts alongside the final frame.
+        def fetch_page(offset):
+            return pd.DataFrame(
+                range_query(source, select_cols).order("id").range(offset, offset + batch_size - 1).execute().data or []
+            )
+
+        pages = [page for page in get_executor().map(fetch_page, range(0, total, batch_size)) if not page.empty]
     except Exception as e:
         print(f"Error fetching response_pairs: {e}")
-        all_pairs_data = []
+        pages = []
 
     hours_col = "response_hours"
 
-    if all_pairs_data:
-        pairs_df = pd.DataFrame(all_pairs_data)
+    if pages:
+        pairs_df = pd.concat(pages, ignore_index=True)
 
         # Pre-normalize replied_at once (used for excluded/whitelisted lookup).
         pairs_df["_replied_at_norm"] = pairs_df["replied_at"].astype(str).map(_norm_ts)
 
-        # Filter out excluded pairs. We bound the query by the same date
-        # range so we don't full-scan the table.
-        try:
-            excluded_result = supabase.table("excluded_response_pairs").select(
-                "thread_id, replied_at"
-            ).gte(
-                "replied_at", start_date.isoformat()
-            ).lte(
-                "replied_at", end_date.isoformat() + "T23:59:59"
-            ).execute()
-            if excluded_result.data:
-                excluded_keys = {
-                    (ep["thread_id"], _norm_ts(ep["replied_at"]))
-                    for ep in excluded_result.data
-                }
-                # Vectorized filter: build a tuple Series, then .isin.
-                key_series = pd.Series(
-                    list(zip(pairs_df["thread_id"], pairs_df["_replied_at_norm"])),
-                    index=pairs_df.index,
-                )
-                pairs_df = pairs_df[~key_series.isin(excluded_keys)]
-        except Exception:
-            pass  # Table doesn't exist yet, no exclusions to apply
+        # Filter out excluded pairs (already done server-side when reading
+        # the view). We bound the query by the same date range so we don't
+        # full-scan the table.
+        if source == "response_pairs":
+            try:
+                excluded_result = supabase.table("excluded_response_pairs").select(
+                    "thread_id, replied_at"
+                ).gte(
+                    "replied_at", start_date.isoformat()
+                ).lte(
+                    "replied_at", end_date.isoformat() + "T23:59:59"
+                ).execute()
+                if excluded_result.data:
+                    excluded_keys = {
+                        (ep["thread_id"], _norm_ts(ep["replied_at"]))
+                        for ep in excluded_result.data
+                    }
+                    # Vectorized filter: hashed MultiIndex lookup, no per-row tuples.
+                    pair_keys = pd.MultiIndex.from_arrays([pairs_df["thread_id"], pairs_df["_replied_at_norm"]])
+                    pairs_df = pairs_df[~pair_keys.isin(excluded_keys)]
+            except Exception:
+                pass  # Table doesn't exist yet, no exclusions to apply
 
         # Recalculate adjusted hours dynamically using current OOO and work
         # settings so that OOO periods added after tracking are correctly
         # reflected. Cached via lru_cache, so repeated input tuples are free.
         if use_adjusted:
-            user_settings_cache: dict = {}
-            user_ooo_cache: dict = {}
-
-            def _recalc(row):
-                email = row["user_email"]
-                if email not in user_settings_cache:
-                    user_settings_cache[email] = get_user_work_settings(email)
-                    user_ooo_cache[email] = get_user_ooo_dates(email)
-                settings = user_settings_cache[email]
-                ooo = user_ooo_cache[email]  # already a frozenset
-                try:
-                    recv = datetime.fromisoformat(str(row["received_at"]))
-                    repl = datetime.fromisoformat(str(row["replied_at"]))
-                    if recv.tzinfo is None:
-                        recv = recv.replace(tzinfo=timezone.utc)
-                    if repl.tzinfo is None:
-                        repl = repl.replace(tzinfo=timezone.utc)
-                    return _calculate_adjusted_hours_cached(
-                        recv, repl, settings["timezone"], settings["exclude_weekends"], ooo
-                    )
-                except Exception:
-                    return row.get("response_hours")
-
-            pairs_df["adjusted_response_hours"] = pairs_df.apply(_recalc, axis=1)
+            emails = pairs_df["user_email"].unique()
+            pairs_df["adjusted_response_hours"] = _adjusted_hours_array(
+                pairs_df["user_email"], pairs_df["received_at"], pairs_df["replied_at"], pairs_df["response_hours"],
+                {email: get_user_work_settings(email) for email in emails},
+                {email: get_user_ooo_dates(email) for email in emails},
+            )
             hours_col = "adjusted_response_hours"
 
         pairs_df[hours_col] = pd.to_numeric(pairs_df[hours_col], errors="coerce")
@@ -499,46 +790,98 @@ def get_stats_from_supabase(start_date: date, end_date: date, use_adjusted: bool
                         (wp["thread_id"], _norm_ts(wp["replied_at"]))
                         for wp in wl_result.data
                     }
-                    wl_key_series = pd.Series(
-                        list(zip(pairs_df["thread_id"], pairs_df["_replied_at_norm"])),
-                        index=pairs_df.index,
-                    )
-                    is_whitelisted = wl_key_series.isin(wl_keys)
+                    pair_keys = pd.MultiIndex.from_arrays([pairs_df["thread_id"], pairs_df["_replied_at_norm"]])
+                    is_whitelisted = pair_keys.isin(wl_keys)
                     pairs_df = pairs_df[(pairs_df[hours_col] <= 120) | is_whitelisted]
                 else:
                     pairs_df = pairs_df[pairs_df[hours_col] <= 120]
             except Exception:
                 pairs_df = pairs_df[pairs_df[hours_col] <= 120]
 
-        # Drop the helper column before aggregating.
-        pairs_df = pairs_df.drop(columns=["_replied_at_norm"], errors="ignore")
-
         # True per-user mean and median from the raw response_hours values.
-        user_stats = pairs_df.groupby("user_email")[hours_col].agg(["mean", "median"]).reset_index()
-        user_stats.columns = ["user_email", "avg_response_hours", "median_response_hours"]
+        # Factorize the emails once, then sort by (user, hours) so each
+        # user's values are one contiguous sorted run: the mean is a
+        # bincount and the median is read straight off the middle of the run.
+        codes, emails = pd.factorize(pairs_df["user_email"])
+        values = pairs_df[hours_col].to_numpy(dtype=float)
+        counts = np.bincount(codes, minlength=len(emails))
+        means = np.bincount(codes, weights=values, minlength=len(emails)) / counts
+
+        sorted_values = values[np.lexsort((values, codes))]
+        starts = np.cumsum(counts) - counts
+        medians = (sorted_values[starts + (counts - 1) // 2] + sorted_values[starts + counts // 2]) / 2
+
+        return pd.DataFrame(dict(zip(PAIR_STATS_COLUMNS, [emails, means, medians])))
+    return pd.DataFrame(columns=PAIR_STATS_COLUMNS)
+
+
+@st.cache_data(ttl=CACHE_TTL_SECONDS, show_spinner=False)
+def get_stats_from_supabase(start_date: date, end_date: date, use_adjusted: bool = False, exclude_long_responses: bool = True) -> pd.DataFrame:
+    """
+    Fetch aggregated per-user stats from Supabase for the given date range.
+
+    Caching: this is the heaviest read on the dashboard. Wrapping it with
+    @st.cache_data means changing the domain/team/individual filter is a
+    cache hit (no network round-trip), and only changing start_date /
+    end_date / use_adjusted / exclude_long_responses re-runs the queries.
+
+    Performance notes:
+    - Per-user email totals are summed in Postgres by the daily_stats_agg
+      RPC, so one row per user comes back instead of one per user per day,
+      already joined with tracked_users.
+    - Raw-hours mean/median come from the response_pair_stats RPC; the
+      client-side fallback paginates response_pairs to handle Supabase's
+      1000-row default cap.
+    - excluded_response_pairs and whitelisted_response_pairs are filtered by
+      replied_at on the same date range so we don't full-scan those tables.
+    - Client-side, excluded and whitelisted pairs are matched with a hashed
+      pd.MultiIndex.isin over (thread_id, replied_at) keys (excluded pairs are
+      dropped server-side when the response_pairs_included view exists), and
+      the >120h cut is one boolean mask; mean/median are computed per user
+      with factorize + bincount over sorted runs (no DataFrame.apply/groupby).
+    - When use_adjusted=True, calculate_adjusted_hours is memoized via
+      lru_cache so repeated (recv, repl, tz, exclude_weekends, ooo) tuples
+      only do the date-loop math once.
+    """
+    supabase = get_supabase()
+
+    # Email counts per user (these sums are correct from daily_stats).
+    aggregated = _fetch_daily_totals(supabase, start_date, end_date)
+    if aggregated.empty:
+        return pd.DataFrame()
+
+    # True per-user mean/median from raw response_pairs (per-day medians
+    # can't be combined into a true per-user median). When daily_stats shows
+    # no pairs at all in the range (common for narrow windows), there's
+    # nothing to fetch.
+    if aggregated["response_pairs_count"].fillna(0).sum() > 0:
+        user_stats = _fetch_pair_stats(supabase, start_date, end_date, use_adjusted, exclude_long_responses)
         aggregated = aggregated.merge(user_stats, on="user_email", how="left")
     else:
-        aggregated["avg_response_hours"] = None
-        aggregated["median_response_hours"] = None
+        aggregated["avg_response_hours"] = np.nan
+        aggregated["median_response_hours"] = np.nan
 
-    # Fetch user info (domain, display_name, team_function) once.
-    try:
-        users_result = supabase.table("tracked_users").select(
-            "email, domain, display_name, team_function"
-        ).execute()
-    except Exception:
-        users_result = None
+    # User info (domain, display_name, team_function) comes back joined from
+    # the daily_stats_agg RPC; only the client-side fallback needs a lookup.
+    if "display_name" not in aggregated.columns:
+        try:
+            users_result = supabase.table("tracked_users").select(
+                "email, domain, display_name, team_function"
+            ).execute()
+        except Exception:
+            users_result = None
 
-    if users_result and users_result.data:
-        users_df = pd.DataFrame(users_result.data)
-        aggregated = aggregated.merge(
-            users_df, left_on="user_email", right_on="email", how="left"
-        )
+        if users_result and users_result.data:
+            users_df = pd.DataFrame(users_result.data)
+            aggregated = aggregated.merge(
+                users_df, left_on="user_email", right_on="email", how="left"
+            )
 
     # Vectorized fallbacks for missing user info — one ufunc each, no
     # apply(axis=1).
-    email_local_part = aggregated["user_email"].str.split("@").str[0]
-    email_domain_part = aggregated["user_email"].str.split("@").str[1].fillna("unknown")
+    email_parts = aggregated["user_email"].str.split("@", n=1, expand=True).reindex(columns=[0, 1])
+    email_local_part = email_parts[0]
+    email_domain_part = email_parts[1].fillna("unknown")
     if "domain" in aggregated.columns:
         aggregated["domain"] = aggregated["domain"].fillna(email_domain_part)
     else:
@@ -552,41 +895,45 @@ def get_stats_from_supabase(start_date: date, end_date: date, use_adjusted: bool
     else:
         aggregated["team_function"] = "unknown"
 
-    # Rename columns to match dashboard format
-    aggregated = aggregated.rename(columns={
-        "user_email": "Email",
-        "avg_response_hours": "Avg Response (hrs)",
-        "median_response_hours": "Median Response (hrs)",
-        "emails_received": "Emails Received",
-        "emails_sent": "Emails Sent",
-        "response_pairs_count": "Responses Tracked",
-        "domain": "Domain",
-        "display_name": "Name",
-        "team_function": "Team",
+    # Build the dashboard frame in one shot, in display order, converting
+    # each column straight from its source - no rename/round/reorder chain
+    # of intermediate DataFrames.
+    def rounded_hours(col):
+        return np.round(pd.to_numeric(aggregated[col], errors="coerce").to_numpy(dtype=float), 1)
+
+    # Counts as int64 once here, so display code never converts per value
+    counts = aggregated[["response_pairs_count", "emails_received", "emails_sent"]].fillna(0).to_numpy(dtype="int64")
+
+    return pd.DataFrame({
+        # Arrow-backed strings serialize to st.dataframe without a per-cell
+        # Python object conversion
+        "Name": pd.array(aggregated["display_name"].to_numpy(), dtype="string[pyarrow]"),
+        "Email": pd.array(aggregated["user_email"].to_numpy(), dtype="string[pyarrow]"),
+        # Low-cardinality labels as category: filter comparisons and unique()
+        # work on the small integer codes instead of per-row Python strings
+        "Domain": pd.Categorical(aggregated["domain"].to_numpy()),
+        "Team": pd.Categorical(aggregated["team_function"].to_numpy()),
+        "Median Response (hrs)": rounded_hours("median_response_hours"),
+        "Avg Response (hrs)": rounded_hours("avg_response_hours"),
+        "Responses Tracked": counts[:, 0],
+        "Emails Received": counts[:, 1],
+        "Emails Sent": counts[:, 2],
     })
 
-    aggregated["Avg Response (hrs)"] = pd.to_numeric(aggregated["Avg Response (hrs)"], errors='coerce').round(1)
-    aggregated["Median Response (hrs)"] = pd.to_numeric(aggregated["Median Response (hrs)"], errors='coerce').round(1)
-
-    column_order = [
-        "Name", "Email", "Domain", "Team",
-        "Median Response (hrs)", "Avg Response (hrs)",
-        "Responses Tracked", "Emails Received", "Emails Sent",
-    ]
-    column_order = [c for c in column_order if c in aggregated.columns]
-    aggregated = aggregated[column_order]
-
-    return aggregated
-
 
 @st.cache_data(ttl=CACHE_TTL_SECONDS, show_spinner=False)
-def get_daily_trend(user_email: str, start_date: date, end_date: date) -> pd.DataFrame:
+def get_daily_trend(user_email: str, start_date: date, end_date: date) -> dict:
     """
-    Fetch daily trend data for a specific user.
+    Fetch daily trend data for a specific user as a dict of column name ->
+    numpy array (ordered by date), ready to pass straight to a Plotly trace.
+    Returns an empty dict when there is no data.
     """
     supabase = get_supabase()
 
-    result = supabase.table("daily_stats").select("*").eq(
+    result = supabase.table("daily_stats").select(
+        "date, emails_received, emails_sent, response_pairs_count, "
+        "avg_response_hours, median_response_hours, min_response_hours, max_response_hours"
+    ).eq(
         "user_email", user_email
     ).gte(
         "date", start_date.isoformat()
@@ -595,9 +942,9 @@ def get_daily_trend(user_email: str, start_date: date, end_date: date) -> pd.Dat
     ).order("date").execute()
 
     if not result.data:
-        return pd.DataFrame()
+        return {}
 
-    return pd.DataFrame(result.data)
+    return {col: np.asarray([row[col] for row in result.data]) for col in result.data[0]}
 
 
 @st.cache_data(ttl=CACHE_TTL_SECONDS, show_spinner=False)
@@ -624,27 +971,12 @@ def get_received_emails(user_email: str, start_date: date, end_date: date, limit
 
     df = pd.DataFrame(result.data)
 
-    # Format timestamps
-    df['received_at'] = pd.to_datetime(df['received_at']).dt.strftime('%b %d, %H:%M')
-    df['replied_at'] = df['replied_at'].apply(
-        lambda x: pd.to_datetime(x).strftime('%b %d, %H:%M') if pd.notna(x) and x else ""
-    )
+    # Format timestamps (unreplied rows get "" for replied_at)
+    df['received_at'], df['replied_at'] = _format_display_timestamps(df['received_at'], df['replied_at'])
 
     # Format response time
-    def format_response_time(hours):
-        if pd.isna(hours) or hours is None:
-            return ""
-        if hours < 1:
-            return f"{int(hours * 60)}m"
-        elif hours < 24:
-            return f"{int(hours)}h {int((hours % 1) * 60)}m"
-        else:
-            days = int(hours / 24)
-            remaining_hours = int(hours % 24)
-            return f"{days}d {remaining_hours}h"
-
-    df['response_time'] = df['response_hours'].apply(format_response_time)
-    df['replied'] = df['replied'].apply(lambda x: "Yes" if x else "No")
+    df['response_time'] = _format_response_times(df['response_hours'])
+    df['replied'] = np.where(df['replied'].eq(True), "Yes", "No")
 
     # Truncate long fields
     df['sender_email'] = df['sender_email'].str[:35]
@@ -658,6 +990,11 @@ def get_received_emails(user_email: str, start_date: date, end_date: date, limit
     return df
 
 
+# "12am", "1am", ... "11pm", indexed by hour of day
+HOUR_LABELS = [f"{h % 12 or 12}{'am' if h < 12 else 'pm'}" for h in range(24)]
+
+
+@st.cache_data(ttl=CACHE_TTL_SECONDS, show_spinner=False)
 def get_hourly_distribution(user_email: str, start_date: date, end_date: date) -> pd.DataFrame:
     """Fetch received emails and return count by hour of day (0-23) in user's local timezone."""
     supabase = get_supabase()
@@ -688,38 +1025,52 @@ def get_hourly_distribution(user_email: str, start_date: date, end_date: date) -
     if not all_data:
         return pd.DataFrame()
 
-    hours = []
-    for row in all_data:
-        try:
-            dt = datetime.fromisoformat(row["received_at"])
-            if dt.tzinfo is None:
-                dt = dt.replace(tzinfo=timezone.utc)
-            local_dt = dt.astimezone(user_tz)
-            hours.append(local_dt.hour)
-        except Exception:
-            pass
-
-    if not hours:
+    # One ISO8601 parse for the whole column (naive values read as UTC,
+    # unparseable ones dropped), then a vectorized conversion to local time.
+    received = pd.to_datetime(
+        pd.Series([row["received_at"] for row in all_data]),
+        utc=True, errors="coerce", format="ISO8601", cache=True,
+    ).dropna()
+    if received.empty:
         return pd.DataFrame()
 
-    counts = pd.Series(hours).value_counts().reindex(range(24), fill_value=0).reset_index()
-    counts.columns = ["Hour", "Emails Received"]
-    counts["Hour Label"] = counts["Hour"].apply(
-        lambda h: f"{h % 12 or 12}{'am' if h < 12 else 'pm'}"
-    )
-    return counts
+    hours = received.dt.tz_convert(user_tz).dt.hour.to_numpy(dtype=np.int64)
+    return pd.DataFrame({
+        "Hour": np.arange(24),
+        "Emails Received": np.bincount(hours, minlength=24),
+        "Hour Label": HOUR_LABELS,
+    })
 
 
 @st.cache_data(ttl=CACHE_TTL_SECONDS, show_spinner=False)
 def get_received_emails_stats(user_email: str, start_date: date, end_date: date) -> dict:
     """
     Get summary stats for received emails (total, replied, reply rate).
+    Both counts come from the received_email_counts RPC (see
+    migrations/create_received_email_counts_function.sql) in one round-trip;
+    falls back to two count requests if the function hasn't been created yet.
     """
     supabase = get_supabase()
 
+    try:
+        result = supabase.rpc("received_email_counts", {
+            "target_email": user_email,
+            "start_date": start_date.isoformat(),
+            "end_date": end_date.isoformat(),
+        }).execute()
+        row = result.data[0] if result.data else {}
+        total = row.get("total") or 0
+        replied = row.get("replied") or 0
+        rate = (replied / total * 100) if total > 0 else 0
+        return {"total": total, "replied": replied, "rate": rate}
+    except Exception:
+        pass  # Function doesn't exist yet - count with two requests below
+
+    # head=True: only the Content-Range count comes back, no row bodies
+
     # Get total count
     total_result = supabase.table("received_emails").select(
-        "id", count="exact"
+        "id", count="exact", head=True
     ).eq(
         "user_email", user_email
     ).gte(
@@ -730,7 +1081,7 @@ def get_received_emails_stats(user_email: str, start_date: date, end_date: date)
 
     # Get replied count
     replied_result = supabase.table("received_emails").select(
-        "id", count="exact"
+        "id", count="exact", head=True
     ).eq(
         "user_email", user_email
     ).eq(
@@ -749,14 +1100,29 @@ def get_received_emails_stats(user_email: str, start_date: date, end_date: date)
 
 
 @st.cache_data(ttl=CACHE_TTL_SECONDS, show_spinner=False)
-def get_recent_response_pairs(user_email: str, start_date: date, end_date: date, limit: int = 10, use_adjusted: bool = False) -> pd.DataFrame:
+def get_recent_response_pairs(user_email: str, start_date: date, end_date: date, limit: int = 10, use_adjusted: bool = False, before: tuple = None) -> pd.DataFrame:
     """
     Fetch the most recent response pairs for a specific user within a date range.
     Includes thread_id and exclusion status for the exclude/restore UI.
+
+    Paging is keyset-based: pass the last row's (raw_replied_at, thread_id)
+    as `before` to get the next-older page. Rows are ordered by
+    (replied_at, thread_id) so pairs sharing a replied_at are split across
+    pages without being skipped. Each page is one indexed range scan, however
+    deep the user pages, unlike OFFSET paging.
     """
     supabase = get_supabase()
 
-    result = supabase.table("response_pairs").select(
+    # The exclusion/whitelist lookups (and OOO/work settings in adjusted
+    # mode) don't depend on the pairs, so fetch them while the pairs query runs
+    executor = get_executor()
+    excluded_future = executor.submit(get_excluded_pairs, user_email)
+    whitelisted_future = executor.submit(get_whitelisted_pairs, user_email)
+    if use_adjusted:
+        ooo_future = executor.submit(get_user_ooo_dates, user_email)
+        work_settings_future = executor.submit(get_user_work_settings, user_email)
+
+    query = supabase.table("response_pairs").select(
         "thread_id, user_email, external_sender, subject, received_at, replied_at, response_hours, adjusted_response_hours"
     ).eq(
         "user_email", user_email
@@ -764,8 +1130,19 @@ def get_recent_response_pairs(user_email: str, start_date: date, end_date: date,
         "replied_at", start_date.isoformat()
     ).lte(
         "replied_at", end_date.isoformat() + "T23:59:59"
-    ).order(
+    )
+    if before:
+        # Strictly older than the cursor row in (replied_at, thread_id) order.
+        # Values are quoted since timestamps contain PostgREST's reserved . and :
+        before_replied_at, before_thread_id = before
+        query = query.or_(
+            f'replied_at.lt."{before_replied_at}",'
+            f'and(replied_at.eq."{before_replied_at}",thread_id.lt."{before_thread_id}")'
+        )
+    result = query.order(
         "replied_at", desc=True
+    ).order(
+        "thread_id", desc=True
     ).limit(limit).execute()
 
     if not result.data:
@@ -777,76 +1154,49 @@ def get_recent_response_pairs(user_email: str, start_date: date, end_date: date,
     df['raw_replied_at'] = df['replied_at']
     df['raw_received_at'] = df['received_at']
 
+    # (thread_id, replied_at) keys for the exclusion/whitelist lookups. Mapping
+    # the MultiIndex through an id dict gives both the row id and (via notna)
+    # the flag in one hashed pass, instead of two apply(axis=1) calls each.
+    pair_keys = pd.MultiIndex.from_arrays([df['thread_id'], df['raw_replied_at']])
+
     # Fetch excluded pairs and mark status
     try:
-        excluded = get_excluded_pairs(user_email)
-        excluded_keys = {(ep["thread_id"], ep["replied_at"]) for ep in excluded}
-        # Build a lookup from (thread_id, replied_at) -> excluded row id
-        excluded_id_map = {(ep["thread_id"], ep["replied_at"]): ep["id"] for ep in excluded}
-        df['excluded'] = df.apply(
-            lambda r: (r["thread_id"], r["raw_replied_at"]) in excluded_keys, axis=1
-        )
-        df['excluded_id'] = df.apply(
-            lambda r: excluded_id_map.get((r["thread_id"], r["raw_replied_at"])), axis=1
-        )
+        excluded = excluded_future.result()
+        excluded_ids = pair_keys.map(
+            {(ep["thread_id"], ep["replied_at"]): ep["id"] for ep in excluded}
+        ).to_numpy(dtype=object)
+        df['excluded'] = pd.notna(excluded_ids)
+        df['excluded_id'] = np.where(df['excluded'], excluded_ids, None)
     except Exception:
         df['excluded'] = False
         df['excluded_id'] = None
 
     # Fetch whitelisted pairs (overrides for >7d filter)
     try:
-        whitelisted = get_whitelisted_pairs(user_email)
-        whitelisted_keys = {(wp["thread_id"], wp["replied_at"]) for wp in whitelisted}
-        whitelisted_id_map = {(wp["thread_id"], wp["replied_at"]): wp["id"] for wp in whitelisted}
-        df['whitelisted'] = df.apply(
-            lambda r: (r["thread_id"], r["raw_replied_at"]) in whitelisted_keys, axis=1
-        )
-        df['whitelisted_id'] = df.apply(
-            lambda r: whitelisted_id_map.get((r["thread_id"], r["raw_replied_at"])), axis=1
-        )
+        whitelisted = whitelisted_future.result()
+        whitelisted_ids = pair_keys.map(
+            {(wp["thread_id"], wp["replied_at"]): wp["id"] for wp in whitelisted}
+        ).to_numpy(dtype=object)
+        df['whitelisted'] = pd.notna(whitelisted_ids)
+        df['whitelisted_id'] = np.where(df['whitelisted'], whitelisted_ids, None)
     except Exception:
         df['whitelisted'] = False
         df['whitelisted_id'] = None
 
     # Dynamically recalculate adjusted hours using current OOO and work settings
     if use_adjusted:
-        ooo_dates = get_user_ooo_dates(user_email)
-        work_settings = get_user_work_settings(user_email)
-
-        def calc_adjusted(row):
-            try:
-                recv = datetime.fromisoformat(str(row["raw_received_at"]))
-                repl = datetime.fromisoformat(str(row["raw_replied_at"]))
-                if recv.tzinfo is None:
-                    recv = recv.replace(tzinfo=timezone.utc)
-                if repl.tzinfo is None:
-                    repl = repl.replace(tzinfo=timezone.utc)
-                return calculate_adjusted_hours(
-                    recv, repl, work_settings["timezone"], work_settings["exclude_weekends"], ooo_dates
-                )
-            except Exception:
-                return row["response_hours"]
-
-        df['display_hours'] = df.apply(calc_adjusted, axis=1)
+        df['display_hours'] = _adjusted_hours_array(
+            df['user_email'], df['raw_received_at'], df['raw_replied_at'], df['response_hours'],
+            {user_email: work_settings_future.result()},
+            {user_email: ooo_future.result()},
+        )
     else:
         df['display_hours'] = df['response_hours']
 
     # Format the data for display
-    df['received_at'] = pd.to_datetime(df['received_at']).dt.strftime('%b %d, %H:%M')
-    df['replied_at'] = pd.to_datetime(df['replied_at']).dt.strftime('%b %d, %H:%M')
+    df['received_at'], df['replied_at'] = _format_display_timestamps(df['received_at'], df['replied_at'])
 
-    # Format response time
-    def format_response_time(hours):
-        if hours < 1:
-            return f"{int(hours * 60)}m"
-        elif hours < 24:
-            return f"{int(hours)}h {int((hours % 1) * 60)}m"
-        else:
-            days = int(hours / 24)
-            remaining_hours = int(hours % 24)
-            return f"{days}d {remaining_hours}h"
-
-    df['response_time'] = df['display_hours'].apply(format_response_time)
+    df['response_time'] = _format_response_times(df['display_hours'])
 
     # Fetch body previews from received_emails keyed by (thread_id, received_at)
     try:
@@ -859,9 +1209,8 @@ def get_recent_response_pairs(user_email: str, start_date: date, end_date: date,
                 (r["thread_id"], r["received_at"]): r.get("body_preview") or ""
                 for r in preview_result.data
             }
-            df['body_preview'] = df.apply(
-                lambda r: preview_map.get((r["thread_id"], r["raw_received_at"]), ""), axis=1
-            )
+            received_keys = pd.MultiIndex.from_arrays([df['thread_id'], df['raw_received_at']])
+            df['body_preview'] = received_keys.map(preview_map).to_numpy(dtype=object)
         else:
             df['body_preview'] = ""
     except Exception:
@@ -876,6 +1225,98 @@ def get_recent_response_pairs(user_email: str, start_date: date, end_date: date,
     return df
 
 
+# Figure builders are cached on the input frame's contents, so a rerun
+# with the same team snapshot (e.g. toggling an unrelated widget) returns
+# the already-built Figure instead of reconstructing every trace.
+@st.cache_data(show_spinner=False, max_entries=50)
+def build_ranking_figure(df_sorted: pd.DataFrame) -> "go.Figure":
+    """
+    Horizontal median-response chart, one row per person. Small teams get
+    labelled bars; above RANKING_WEBGL_THRESHOLD people it's a WebGL marker
+    trace with the labels moved into the hover text.
+    """
+    # plotly is imported here rather than at module level so reruns that
+    # never draw a chart (Manage tab, empty date ranges) skip its import cost.
+    import plotly.graph_objects as go
+
+    fig_ranking = go.Figure()
+
+    medians = df_sorted['Median Response (hrs)'].to_numpy(dtype=float)
+    colors = np.select([medians < 4, medians < 12], ['#00CC96', '#636EFA'], default='#EF553B').tolist()
+    median_text = np.char.mod("Median: %.1fh", medians)
+    avg_text = np.char.mod(" | Avg: %.1fh", df_sorted['Avg Response (hrs)'].to_numpy(dtype=float))
+    labels = np.char.add(median_text, avg_text).tolist()
+
+    if len(df_sorted) > RANKING_WEBGL_THRESHOLD:
+        fig_ranking.add_trace(go.Scattergl(
+            x=df_sorted['Median Response (hrs)'],
+            y=df_sorted['Name'],
+            mode='markers',
+            marker=dict(color=colors, size=10),
+            hovertext=labels,
+            hoverinfo='y+text',
+        ))
+        row_height = 20
+    else:
+        fig_ranking.add_trace(go.Bar(
+            x=df_sorted['Median Response (hrs)'],
+            y=df_sorted['Name'],
+            orientation='h',
+            marker_color=colors,
+            text=labels,
+            textposition='outside'
+        ))
+        row_height = 40
+
+    fig_ranking.update_layout(
+        xaxis_title='Median Response Time (hours)',
+        yaxis_title='',
+        height=50 + len(df_sorted) * row_height,
+        showlegend=False,
+        uirevision="ranking",
+    )
+    return fig_ranking
+
+
+@st.cache_data(show_spinner=False, max_entries=50)
+def build_hourly_figure(hourly_df: pd.DataFrame) -> "go.Figure":
+    """Bar chart of emails received per local hour of day."""
+    import plotly.graph_objects as go
+
+    fig_hourly = go.Figure(go.Bar(
+        x=hourly_df["Hour"],
+        y=hourly_df["Emails Received"],
+        text=hourly_df["Emails Received"],
+        textposition="outside",
+        marker_color="#636EFA",
+        hovertemplate="<b>%{customdata}</b><br>%{y} emails<extra></extra>",
+        customdata=hourly_df["Hour Label"],
+    ))
+    fig_hourly.update_layout(
+        xaxis=dict(
+            tickmode="array",
+            tickvals=list(range(24)),
+            ticktext=hourly_df["Hour Label"].tolist(),
+            title="Hour of Day",
+        ),
+        yaxis_title="Emails Received",
+        showlegend=False,
+        height=350,
+        uirevision="hourly",
+    )
+    return fig_hourly
+
+
+def _select_individual_from_table(table_key: str, emails: list):
+    """
+    on_select callback for the Performance Table. Runs before the rerun, so
+    it can still set the Individual filter's session state.
+    """
+    selected_rows = st.session_state[table_key].selection.rows
+    if selected_rows:
+        st.session_state["individual_filter"] = emails[selected_rows[0]]
+
+
 # Page configuration
 st.set_page_config(
     page_title="Lumiere Email Response Dashboard",
@@ -894,35 +1335,17 @@ with st.sidebar:
     # Time Window Dropdown
     time_window = st.selectbox(
         "Time Window",
-        options=[
-            'Yesterday',
-            'Last 7 Days (Week)',
-            'Last 14 Days (Sprint)',
-            'Last 30 Days (Month)',
-            'Last 90 Days (Quarter)',
-            'Custom Range'
-        ],
+        options=[*TIME_WINDOWS, 'Custom Range'],
         index=2  # Default to Last 14 Days
     )
 
     # Calculate start_date and end_date based on selection
     today = date.today()
 
-    if time_window == 'Yesterday':
-        start_date = today - timedelta(days=1)
-        end_date = today - timedelta(days=1)
-    elif time_window == 'Last 7 Days (Week)':
-        start_date = today - timedelta(days=7)
-        end_date = today
-    elif time_window == 'Last 14 Days (Sprint)':
-        start_date = today - timedelta(days=14)
-        end_date = today
-    elif time_window == 'Last 30 Days (Month)':
-        start_date = today - timedelta(days=30)
-        end_date = today
-    elif time_window == 'Last 90 Days (Quarter)':
-        start_date = today - timedelta(days=90)
-        end_date = today
+    if time_window in TIME_WINDOWS:
+        start_days_back, end_days_back = TIME_WINDOWS[time_window]
+        start_date = today - timedelta(days=start_days_back)
+        end_date = today - timedelta(days=end_days_back)
     else:  # Custom Range
         col_start, col_end = st.columns(2)
         with col_start:
@@ -938,8 +1361,13 @@ with st.sidebar:
                 max_value=today
             )
 
+    # Date range labels, formatted once and reused by the captions below
+    start_label = start_date.strftime('%b %d')
+    end_label = end_date.strftime('%b %d, %Y')
+    range_label = f"{start_label} - {end_label}"
+
     # Show selected date range
-    st.caption(f"{start_date.strftime('%b %d, %Y')} - {end_date.strftime('%b %d, %Y')}")
+    st.caption(f"{start_label}, {start_date.year} - {end_label}")
 
     st.divider()
 
@@ -967,32 +1395,15 @@ with st.sidebar:
 
     filter_note = " Responses taking longer than 5 days are excluded." if exclude_long_responses else ""
 
-    if use_adjusted:
-        st.info(f"""
-        **Data from the last {days} days** ({start_date.strftime('%b %d')} - {end_date.strftime('%b %d, %Y')}) — **Working Hours Adjusted**
-
-        Response times count full 24-hour days but **exclude weekends** (if configured for the user's timezone) and **out-of-office days**. On the day an email is received, time counts from when it arrived to end of day. On the reply day, time counts from start of day to when the reply was sent.
-
-        *Example: An email received Friday at 4 PM with a reply Monday at 10 AM would show ~18 hours (8 hrs Friday + 10 hrs Monday), skipping Saturday and Sunday. If a user is marked as OOO for an entire week, none of those days count toward their response time.*
-
-        This shows email threads between **external senders** and the tracked user. Internal emails (same domain) and automated messages are excluded.{filter_note}
-        """)
-    else:
-        st.info(f"""
-        **Data from the last {days} days** ({start_date.strftime('%b %d')} - {end_date.strftime('%b %d, %Y')}) — **Raw Time**
-
-        Response times are calculated as total elapsed time between receiving an email and sending a reply, including nights, weekends, holidays, and out-of-office days. OOO time is **not** excluded in this mode — switch to **Working Hours Adjusted** to account for OOO periods.
-
-        *Example: An email received Friday at 4 PM with a reply Monday at 10 AM would show ~66 hours.*
-
-        This shows email threads between **external senders** and the tracked user. Internal emails (same domain) and automated messages are excluded.{filter_note}
-        """)
+    st.info(ABOUT_DATA_TEMPLATES[use_adjusted].format(
+        days=days, range_label=range_label, filter_note=filter_note
+    ))
 
     st.divider()
 
     # Refresh Button
     if st.button("Refresh Data", type="primary", use_container_width=True):
-        st.cache_resource.clear()
+        # Only data caches - the Supabase client in cache_resource stays valid
         _clear_data_caches()
         st.session_state.refresh_counter += 1
         st.rerun()
@@ -1007,6 +1418,19 @@ tab_dashboard, tab_manage = st.tabs(["📊 Dashboard", "👥 Manage Team"])
 with tab_manage:
     st.header("Manage Tracked Users")
 
+    # Fetched once per rerun and shared by every section below. The
+    # edit/settings/OOO pickers list active users by email.
+    def active_by_email(users):
+        return sorted((u for u in users if u["is_active"]), key=lambda u: u["email"])
+
+    try:
+        tracked_users = get_tracked_users()
+        tracked_users_error = None
+    except Exception as e:
+        tracked_users = []
+        tracked_users_error = e
+    active_users = active_by_email(tracked_users)
+
     col1, col2 = st.columns(2)
 
     with col1:
@@ -1020,23 +1444,29 @@ with tab_manage:
             help="Select the team this user belongs to"
         )
 
-        timezone_options = [
-            "America/New_York", "America/Chicago", "America/Denver",
-            "America/Los_Angeles", "America/Phoenix", "Europe/London",
-            "Europe/Paris", "Asia/Kolkata", "Asia/Tokyo", "Asia/Shanghai", "UTC"
-        ]
-        user_timezone = st.selectbox("Timezone", options=timezone_options, index=0, key="add_timezone")
+        user_timezone = st.selectbox("Timezone", options=TIMEZONE_OPTIONS, index=0, key="add_timezone")
         exclude_weekends = st.checkbox("Exclude weekends from adjusted time", value=True, key="add_exclude_weekends")
 
         fetch_history = st.checkbox("Fetch 90 days of email history", value=True)
 
         if st.button("Add User & Fetch Data", use_container_width=True, type="primary"):
             if new_email and "@" in new_email:
-                # First check if we have Gmail access for this user
+                # First check if we have Gmail access for this user. The check
+                # runs on the shared executor while we look up whether the
+                # email is already tracked, so the two round-trips overlap.
                 with st.spinner("Checking Gmail access..."):
-                    has_access, access_msg = check_gmail_access(new_email)
-
-                if not has_access:
+                    access_future = get_executor().submit(check_gmail_access, new_email)
+                    try:
+                        existing = get_supabase().table("tracked_users").select("email").eq("email", new_email).limit(1).execute()
+                        already_tracked = bool(existing.data)
+                    except Exception:
+                        already_tracked = False  # The insert below still reports duplicates
+                    if not already_tracked:
+                        has_access, access_msg = access_future.result()
+
+                if already_tracked:
+                    st.warning(f"{new_email} is already being tracked.")
+                elif not has_access:
                     if access_msg.startswith("domain_not_connected:"):
                         domain = access_msg.split(":")[1]
                         st.error(f"❌ Cannot access Gmail for @{domain}")
@@ -1106,8 +1536,9 @@ with tab_manage:
                         else:
                             st.info("Auto-fetch not configured. Add GITHUB_TOKEN to enable.")
 
-                        st.cache_resource.clear()
                         _clear_data_caches()
+                        tracked_users = get_tracked_users()  # Show the new user in Currently Tracked
+                        active_users = active_by_email(tracked_users)
                     except Exception as e:
                         if "duplicate" in str(e).lower():
                             st.warning(f"{new_email} is already being tracked.")
@@ -1116,32 +1547,123 @@ with tab_manage:
             else:
                 st.warning("Please enter a valid email address.")
 
+        with st.expander("Bulk Add from CSV"):
+            st.caption(
+                "CSV with an `email` column and optional `display_name` and `team_function` columns. "
+                "Timezone, weekend and history settings are taken from the form above."
+            )
+            bulk_file = st.file_uploader("Users CSV", type="csv", key="bulk_add_csv")
+            if bulk_file is not None:
+                try:
+                    bulk_df = pd.read_csv(bulk_file, dtype=str).fillna("")
+                except Exception as e:
+                    bulk_df = None
+                    st.error(f"Could not read CSV: {e}")
+
+                if bulk_df is not None and "email" not in bulk_df.columns:
+                    st.error("CSV must have an `email` column.")
+                elif bulk_df is not None:
+                    bulk_df["email"] = bulk_df["email"].str.strip().str.lower()
+                    bulk_df = bulk_df[bulk_df["email"].str.contains("@", regex=False)].drop_duplicates("email")
+                    team_options = {"operations", "growth", "other"}
+                    if "team_function" not in bulk_df.columns:
+                        bulk_df["team_function"] = ""
+                    bulk_df["team_function"] = bulk_df["team_function"].str.strip().str.lower()
+                    # If the list failed to load, the insert below still rejects duplicates
+                    already_tracked = {u["email"].lower() for u in tracked_users}
+                    new_rows = bulk_df[~bulk_df["email"].isin(already_tracked)]
+                    skipped = len(bulk_df) - len(new_rows)
+                    st.write(f"{len(new_rows)} new users to add" + (f" ({skipped} already tracked)" if skipped else ""))
+
+                    # Blank teams quietly take the form's team; anything else
+                    # unrecognized is called out before adding
+                    unmatched_team = new_rows[(new_rows["team_function"] != "") & ~new_rows["team_function"].isin(team_options)]
+                    if len(unmatched_team):
+                        st.warning(
+                            f"Unrecognized team for {len(unmatched_team)} of the new users (expected one of "
+                            f"{', '.join(sorted(team_options))}); they will be added to **{team_function}**."
+                        )
+                        st.dataframe(
+                            unmatched_team[["email", "team_function"]].rename(columns={"email": "Email", "team_function": "Team"}),
+                            use_container_width=True,
+                            hide_index=True,
+                        )
+
+                    if len(new_rows) and st.button(f"Add {len(new_rows)} Users & Fetch Data", key="bulk_add_btn"):
+                        emails = new_rows["email"].tolist()
+
+                        # Gmail access checks are independent, so run them concurrently
+                        with st.spinner(f"Checking Gmail access for {len(emails)} users..."):
+                            access_results = list(get_executor().map(check_gmail_access, emails))
+
+                        allowed = [email for email, (ok, _) in zip(emails, access_results) if ok]
+                        failed = [(email, msg) for email, (ok, msg) in zip(emails, access_results) if not ok]
+
+                        if allowed:
+                            records = [
+                                {
+                                    "email": row["email"],
+                                    "display_name": row.get("display_name") or None,
+                                    "domain": row["email"].split("@")[1],
+                                    "team_function": row["team_function"] if row["team_function"] in team_options else team_function,
+                                    "is_active": True,
+                                    "timezone": user_timezone,
+                                    "exclude_weekends": exclude_weekends,
+                                }
+                                for row in new_rows[new_rows["email"].isin(allowed)].to_dict("records")
+                            ]
+                            try:
+                                # One round-trip for the whole batch
+                                get_supabase().table("tracked_users").insert(records).execute()
+                                st.success(f"✅ Added {len(records)} users to tracked users!")
+
+                                if os.getenv("GITHUB_TOKEN"):
+                                    dispatches = list(get_executor().map(
+                                        lambda email: trigger_github_workflow(email, backfill=fetch_history),
+                                        allowed,
+                                    ))
+                                    dispatch_failures = [msg for ok, msg in dispatches if not ok]
+                                    if dispatch_failures:
+                                        st.warning(f"Could not auto-fetch for {len(dispatch_failures)} users: {dispatch_failures[0]}")
+                                    else:
+                                        st.info("⏱️ Data fetch started for each new user. Takes 3-5 minutes per user.")
+                                else:
+                                    st.info("Auto-fetch not configured. Add GITHUB_TOKEN to enable.")
+
+                                _clear_data_caches()
+                                # Show the new users in Currently Tracked and the pickers below
+                                tracked_users = get_tracked_users()
+                                active_users = active_by_email(tracked_users)
+                            except Exception as e:
+                                st.error(f"Error adding users: {e}")
+
+                        if failed:
+                            st.error(f"❌ Could not verify Gmail access for {len(failed)} users; they were not added.")
+                            st.dataframe(
+                                pd.DataFrame(failed, columns=["Email", "Reason"]),
+                                use_container_width=True,
+                                hide_index=True,
+                            )
+
     with col2:
         st.subheader("Currently Tracked")
-        try:
-            supabase = get_supabase()
-            users = supabase.table("tracked_users").select("email, display_name, domain, is_active, team_function").order("domain").execute()
-            if users.data:
-                # Group by domain
-                domains = {}
-                for user in users.data:
-                    domain = user.get("domain") or user["email"].split("@")[1]
-                    if domain not in domains:
-                        domains[domain] = []
-                    domains[domain].append(user)
-
-                for domain, domain_users in domains.items():
-                    st.markdown(f"**@{domain}** ({len(domain_users)})")
-                    for user in domain_users:
-                        status = "✅" if user["is_active"] else "❌"
-                        name = user.get('display_name') or user['email'].split('@')[0]
-                        team = user.get('team_function') or ''
-                        team_label = f" [{team}]" if team else ""
-                        st.write(f"  {status} {name}{team_label}")
-            else:
-                st.write("No users being tracked yet.")
-        except Exception as e:
-            st.error(f"Error loading users: {e}")
+        if tracked_users_error:
+            st.error(f"Error loading users: {tracked_users_error}")
+        elif tracked_users:
+            # One markdown element per domain (lines joined with hard breaks)
+            # rather than one st.write per user keeps the element count flat
+            # as the team grows. The grouping is cached alongside the list.
+            for domain, domain_group in get_tracked_users_by_domain().items():
+                lines = []
+                for user in domain_group:
+                    status = "✅" if user["is_active"] else "❌"
+                    name = user.get('display_name') or user['email'].split('@')[0]
+                    team = user.get('team_function') or ''
+                    team_label = f" [{team}]" if team else ""
+                    lines.append(f"{status} {name}{team_label}")
+                st.markdown(f"**@{domain}** ({len(lines)})  \n" + "  \n".join(lines))
+        else:
+            st.write("No users being tracked yet.")
 
     st.divider()
 
@@ -1149,12 +1671,13 @@ with tab_manage:
     st.caption("Change the team assignment for an existing tracked user")
     try:
         supabase_edit = get_supabase()
-        edit_users = supabase_edit.table("tracked_users").select("email, display_name, team_function").eq("is_active", True).order("email").execute()
-        if edit_users.data:
+        if tracked_users_error:
+            st.error(f"Error loading users: {tracked_users_error}")
+        elif active_users:
             edit_col1, edit_col2, edit_col3 = st.columns([2, 2, 1])
             edit_options = {
                 (u.get("display_name") or u["email"].split("@")[0]) + f" ({u['email']})": u["email"]
-                for u in edit_users.data
+                for u in active_users
             }
             with edit_col1:
                 selected_label = st.selectbox("Select user", list(edit_options.keys()), key="edit_team_user")
@@ -1170,7 +1693,6 @@ with tab_manage:
                     selected_email = edit_options[selected_label]
                     supabase_edit.table("tracked_users").update({"team_function": new_team}).eq("email", selected_email).execute()
                     st.success(f"Updated team for {selected_email} to {new_team}")
-                    st.cache_resource.clear()
                     _clear_data_caches()
         else:
             st.write("No active users to edit.")
@@ -1184,27 +1706,20 @@ with tab_manage:
 
     try:
         supabase_hours = get_supabase()
-        hours_users = supabase_hours.table("tracked_users").select(
-            "email, display_name, timezone, exclude_weekends"
-        ).eq("is_active", True).order("email").execute()
-
-        if hours_users.data:
+        if tracked_users_error:
+            st.error(f"Error: {tracked_users_error}")
+        elif active_users:
             hours_options = {
                 (u.get("display_name") or u["email"].split("@")[0]) + f" ({u['email']})": u
-                for u in hours_users.data
+                for u in active_users
             }
 
             selected_hours_label = st.selectbox("Select user", list(hours_options.keys()), key="hours_user")
             selected_hours_user = hours_options[selected_hours_label]
 
-            timezone_options = [
-                "America/New_York", "America/Chicago", "America/Denver",
-                "America/Los_Angeles", "America/Phoenix", "Europe/London",
-                "Europe/Paris", "Asia/Kolkata", "Asia/Tokyo", "Asia/Shanghai", "UTC"
-            ]
             current_tz = selected_hours_user.get("timezone") or "America/New_York"
-            current_tz_idx = timezone_options.index(current_tz) if current_tz in timezone_options else 0
-            new_timezone = st.selectbox("Timezone", options=timezone_options, index=current_tz_idx, key="edit_timezone")
+            current_tz_idx = TIMEZONE_INDEX.get(current_tz, 0)
+            new_timezone = st.selectbox("Timezone", options=TIMEZONE_OPTIONS, index=current_tz_idx, key="edit_timezone")
 
             new_exclude_weekends = st.checkbox(
                 "Exclude weekends",
@@ -1218,7 +1733,6 @@ with tab_manage:
                     "exclude_weekends": new_exclude_weekends,
                 }).eq("email", selected_hours_user["email"]).execute()
                 st.success(f"Updated settings for {selected_hours_user['email']}")
-                st.cache_resource.clear()
                 _clear_data_caches()
         else:
             st.write("No active users to edit.")
@@ -1231,26 +1745,20 @@ with tab_manage:
     st.caption("Overview of timezone and weekend settings for all active users")
 
     try:
-        supabase_view = get_supabase()
-        view_users = supabase_view.table("tracked_users").select(
-            "email, display_name, timezone, exclude_weekends"
-        ).eq("is_active", True).order("email").execute()
-
-        if view_users.data:
-            # Build display data
-            display_data = []
-            for u in view_users.data:
-                name = u.get("display_name") or u["email"].split("@")[0]
-                tz = u.get("timezone") or "America/New_York"
-                weekends = "No" if u.get("exclude_weekends", True) else "Yes"
-                display_data.append({
-                    "Name": name,
-                    "Email": u["email"],
-                    "Timezone": tz,
-                    "Include Weekends": weekends,
-                })
-
-            view_df = pd.DataFrame(display_data)
+        if tracked_users_error:
+            st.error(f"Error loading settings: {tracked_users_error}")
+        elif active_users:
+            # Build display data column-wise: empty names/timezones fall back
+            # to the email's local part / the default zone, one fillna each.
+            users_df = pd.DataFrame(active_users)
+            view_df = pd.DataFrame({
+                "Name": users_df["display_name"].replace("", None).fillna(
+                    users_df["email"].str.split("@", n=1).str[0]
+                ),
+                "Email": users_df["email"],
+                "Timezone": users_df["timezone"].replace("", None).fillna("America/New_York"),
+                "Include Weekends": np.where(users_df["exclude_weekends"].eq(True), "No", "Yes"),
+            })
             st.dataframe(
                 view_df,
                 use_container_width=True,
@@ -1274,59 +1782,103 @@ with tab_manage:
 
     try:
         supabase_ooo = get_supabase()
-        ooo_users = supabase_ooo.table("tracked_users").select("email, display_name").eq("is_active", True).order("email").execute()
-
-        if ooo_users.data:
+        if tracked_users_error:
+            st.error(f"Error: {tracked_users_error}")
+        elif active_users:
             ooo_options = {
                 (u.get("display_name") or u["email"].split("@")[0]) + f" ({u['email']})": u["email"]
-                for u in ooo_users.data
+                for u in active_users
             }
 
             ooo_col1, ooo_col2 = st.columns(2)
 
             with ooo_col1:
-                st.markdown("**Add OOO Period**")
+                st.markdown("**Add OOO Periods**")
                 selected_ooo_user = st.selectbox("User", list(ooo_options.keys()), key="ooo_user")
                 ooo_email = ooo_options[selected_ooo_user]
 
-                ooo_start = st.date_input("Start Date", key="ooo_start")
-                ooo_end = st.date_input("End Date", key="ooo_end")
-                ooo_description = st.text_input("Description (optional)", placeholder="Vacation, sick leave, etc.", key="ooo_desc")
-
-                if st.button("Add OOO Period", use_container_width=True, key="add_ooo_btn"):
-                    if ooo_end >= ooo_start:
-                        supabase_ooo.table("user_out_of_office").insert({
-                            "user_email": ooo_email,
-                            "start_date": ooo_start.isoformat(),
-                            "end_date": ooo_end.isoformat(),
-                            "description": ooo_description if ooo_description else None,
-                        }).execute()
-                        st.success(f"Added OOO period for {ooo_email}")
-                        st.cache_resource.clear()
+                # One row per period (any user); a blank End means a single day
+                st.caption("Add a row per period. Leave End blank for a single day.")
+                new_ooo = st.data_editor(
+                    pd.DataFrame({
+                        "User": pd.Series(dtype="object"),
+                        "Start": pd.Series(dtype="datetime64[ns]"),
+                        "End": pd.Series(dtype="datetime64[ns]"),
+                        "Description": pd.Series(dtype="object"),
+                    }),
+                    num_rows="dynamic",
+                    use_container_width=True,
+                    hide_index=True,
+                    column_config={
+                        "User": st.column_config.SelectboxColumn("User", options=list(ooo_options.values()), default=ooo_email, required=True),
+                        "Start": st.column_config.DateColumn("Start", required=True),
+                        "End": st.column_config.DateColumn("End"),
+                        "Description": st.column_config.TextColumn("Description", help="Vacation, sick leave, etc."),
+                    },
+                    key="ooo_new_editor",
+                )
+
+                if st.button("Add OOO Periods", use_container_width=True, key="add_ooo_btn"):
+                    pending = new_ooo.dropna(subset=["User", "Start"])
+                    starts = pd.to_datetime(pending["Start"])
+                    ends = pd.to_datetime(pending["End"]).fillna(starts)
+                    if pending.empty:
+                        st.warning("Add at least one row with a user and start date")
+                    elif (ends < starts).any():
+                        st.warning("End date must be on or after start date")
+                    else:
+                        descriptions = pending["Description"].replace("", None)
+                        rows = [
+                            {
+                                "user_email": user,
+                                "start_date": start.date().isoformat(),
+                                "end_date": end.date().isoformat(),
+                                "description": desc if pd.notna(desc) else None,
+                            }
+                            for user, start, end, desc in zip(pending["User"], starts, ends, descriptions)
+                        ]
+                        # One request per batch rather than one per period
+                        for i in range(0, len(rows), OOO_INSERT_BATCH_SIZE):
+                            supabase_ooo.table("user_out_of_office").insert(rows[i:i + OOO_INSERT_BATCH_SIZE]).execute()
+                        st.success(f"Added {len(rows)} OOO periods")
                         _clear_data_caches()
+                        st.session_state.pop("ooo_new_editor", None)
                         st.rerun()
-                    else:
-                        st.warning("End date must be on or after start date")
 
             with ooo_col2:
                 st.markdown("**Current OOO Periods**")
                 # Show existing OOO for selected user
-                existing_ooo = supabase_ooo.table("user_out_of_office").select("*").eq(
-                    "user_email", ooo_email
-                ).order("start_date", desc=True).execute()
-
-                if existing_ooo.data:
-                    for ooo in existing_ooo.data:
-                        start = datetime.fromisoformat(ooo["start_date"]).strftime("%b %d, %Y")
-                        end = datetime.fromisoformat(ooo["end_date"]).strftime("%b %d, %Y")
-                        desc = ooo.get("description") or "No description"
-                        col_a, col_b = st.columns([3, 1])
-                        with col_a:
-                            st.write(f"{start} - {end}: {desc}")
-                        with col_b:
-                            if st.button("Delete", key=f"del_ooo_{ooo['id']}"):
-                                supabase_ooo.table("user_out_of_office").delete().eq("id", ooo["id"]).execute()
-                                st.rerun()
+                existing_ooo = get_user_ooo_periods(ooo_email)
+
+                if existing_ooo:
+                    # Select rows and delete them in one request, like the
+                    # response pairs editor on the Dashboard
+                    ooo_df = pd.DataFrame(existing_ooo)
+                    ooo_display = pd.DataFrame({
+                        "Select": False,
+                        "Start": pd.to_datetime(ooo_df["start_date"]).dt.strftime("%b %d, %Y"),
+                        "End": pd.to_datetime(ooo_df["end_date"]).dt.strftime("%b %d, %Y"),
+                        "Description": ooo_df["description"].fillna("No description"),
+                    })
+                    edited_ooo = st.data_editor(
+                        ooo_display,
+                        use_container_width=True,
+                        hide_index=True,
+                        column_config={
+                            "Select": st.column_config.CheckboxColumn("Select", default=False),
+                        },
+                        disabled=["Start", "End", "Description"],
+                        key=f"ooo_editor_{ooo_email}",
+                    )
+                    if st.button("Delete Selected", key="del_ooo_btn"):
+                        selected_ids = ooo_df.loc[edited_ooo["Select"].to_numpy(dtype=bool), "id"].tolist()
+                        if not selected_ids:
+                            st.warning("No OOO periods selected to delete.")
+                        else:
+                            supabase_ooo.table("user_out_of_office").delete().in_("id", selected_ids).execute()
+                            # Adjusted response times depend on OOO dates
+                            _clear_data_caches()
+                            st.rerun()
                 else:
                     st.write("No OOO periods set")
         else:
@@ -1341,9 +1893,7 @@ with tab_manage:
 
     if os.getenv("GITHUB_TOKEN"):
         try:
-            supabase = get_supabase()
-            users_result = supabase.table("tracked_users").select("email").eq("is_active", True).execute()
-            user_emails = [u["email"] for u in users_result.data] if users_result.data else []
+            user_emails = [u["email"] for u in tracked_users if u["is_active"]]
 
             if user_emails:
                 col_sync1, col_sync2 = st.columns([2, 1])
@@ -1367,9 +1917,40 @@ with tab_manage:
         st.info("Add GITHUB_TOKEN to .env to enable manual sync.")
 
 with tab_dashboard:
-    # Fetch data with spinner
-    with st.spinner("Fetching data from Supabase..."):
-        df = get_stats_from_supabase(start_date, end_date, use_adjusted=use_adjusted, exclude_long_responses=exclude_long_responses)
+    # Reruns that don't change the query inputs (filters, table selection,
+    # paging) reuse this session's frame directly; st.cache_data would
+    # otherwise hash the arguments and unpickle a fresh copy on every rerun.
+    # The frame is never mutated below, so sharing it across reruns is safe.
+    stats_key = (start_date, end_date, use_adjusted, exclude_long_responses)
+    stats_memo = st.session_state.get("stats_memo")
+
+    # The Individual filter keeps its value across reruns, so when someone is
+    # already selected their reads can start now and overlap the stats fetch
+    # instead of queuing behind it. The hourly chart and work settings are
+    # collected further down; the received-emails reads only warm the cache,
+    # and the fragment's identical calls then hit it (or wait on the
+    # in-flight request rather than issuing a second one).
+    prefetched_individual = st.session_state.get("individual_filter", "All Individuals")
+    if prefetched_individual != "All Individuals":
+        executor = get_executor()
+        hourly_future = executor.submit(get_hourly_distribution, prefetched_individual, start_date, end_date)
+        work_settings_future = executor.submit(get_user_work_settings, prefetched_individual)
+        executor.submit(get_received_emails_stats, prefetched_individual, start_date, end_date)
+        executor.submit(
+            get_received_emails, prefetched_individual, start_date, end_date,
+            limit=st.session_state.get("num_received_selector", 25),
+        )
+    if (
+        stats_memo is not None
+        and stats_memo["key"] == stats_key
+        and time.monotonic() - stats_memo["fetched_at"] < CACHE_TTL_SECONDS
+    ):
+        df = stats_memo["df"]
+    else:
+        # Fetch data with spinner
+        with st.spinner("Fetching data from Supabase..."):
+            df = get_stats_from_supabase(start_date, end_date, use_adjusted=use_adjusted, exclude_long_responses=exclude_long_responses)
+        st.session_state.stats_memo = {"key": stats_key, "df": df, "fetched_at": time.monotonic()}
 
     if df.empty:
         st.warning("No data found for the selected date range.")
@@ -1380,34 +1961,44 @@ with tab_dashboard:
     filter_col1, filter_col2, filter_col3 = st.columns(3)
 
     with filter_col1:
-        # Domain filter
-        all_domains = ["All Domains"] + sorted(df['Domain'].unique().tolist())
+        # Domain filter. Domain/Team are categoricals built from the full
+        # frame, so their categories are already the sorted unique values.
+        all_domains = ["All Domains"] + df['Domain'].cat.categories.tolist()
         selected_domain = st.selectbox("Domain", options=all_domains, key="domain_filter")
 
     with filter_col2:
         # Team filter
-        all_teams = ["All Teams"] + sorted([t for t in df['Team'].unique().tolist() if t != "unknown"])
+        all_teams = ["All Teams"] + [t for t in df['Team'].cat.categories.tolist() if t != "unknown"]
         selected_team = st.selectbox("Team", options=all_teams, key="team_filter")
 
     with filter_col3:
-        # Individual filter
-        filtered_for_individual = df.copy()
+        # Individual filter. Domain/team are fused into one boolean mask that
+        # is reused for df_filtered below, instead of chained DataFrame slices.
+        group_mask = np.ones(len(df), dtype=bool)
         if selected_domain != "All Domains":
-            filtered_for_individual = filtered_for_individual[filtered_for_individual['Domain'] == selected_domain]
+            group_mask &= (df['Domain'] == selected_domain).to_numpy()
         if selected_team != "All Teams":
-            filtered_for_individual = filtered_for_individual[filtered_for_individual['Team'] == selected_team]
+            group_mask &= (df['Team'] == selected_team).to_numpy()
 
-        individual_options = ["All Individuals"] + filtered_for_individual['Email'].tolist()
+        individual_options = ["All Individuals"] + df['Email'].to_numpy()[group_mask].tolist()
         selected_individual = st.selectbox("Individual", options=individual_options, key="individual_filter")
 
+    # Checked by every individual-only section below; compute it once.
+    is_individual_view = selected_individual != "All Individuals"
+
     # Apply filters
-    df_filtered = df.copy()
-    if selected_domain != "All Domains":
-        df_filtered = df_filtered[df_filtered['Domain'] == selected_domain]
-    if selected_team != "All Teams":
-        df_filtered = df_filtered[df_filtered['Team'] == selected_team]
-    if selected_individual != "All Individuals":
-        df_filtered = df_filtered[df_filtered['Email'] == selected_individual]
+    filter_mask = group_mask
+    if is_individual_view:
+        filter_mask = filter_mask & (df['Email'].to_numpy() == selected_individual)
+    df_filtered = df[filter_mask]
+
+    # The hour-of-day chart at the bottom of the individual view doesn't
+    # depend on anything above it, so (unless they were prefetched for this
+    # person above) start its reads now and let them run while the summary,
+    # table and response pairs render.
+    if is_individual_view and selected_individual != prefetched_individual:
+        hourly_future = get_executor().submit(get_hourly_distribution, selected_individual, start_date, end_date)
+        work_settings_future = get_executor().submit(get_user_work_settings, selected_individual)
 
     st.divider()
 
@@ -1417,40 +2008,52 @@ with tab_dashboard:
         filter_desc.append(f"@{selected_domain}")
     if selected_team != "All Teams":
         filter_desc.append(f"{selected_team.capitalize()}")
-    if selected_individual != "All Individuals":
+    if is_individual_view:
         filter_desc.append(selected_individual)
 
     filter_label = " | ".join(filter_desc) if filter_desc else "All Team Members"
 
     st.subheader(f"Summary: {filter_label}")
-    st.caption(f"{start_date.strftime('%b %d')} - {end_date.strftime('%b %d, %Y')} ({len(df_filtered)} people)")
+    st.caption(f"{range_label} ({len(df_filtered)} people)")
+
+    # One column-wise reduction per dtype: means stay float, count sums stay
+    # int64 (a single mixed agg would upcast the counts to float)
+    means = df_filtered[['Median Response (hrs)', 'Avg Response (hrs)']].mean()
+    totals = df_filtered[['Responses Tracked', 'Emails Received', 'Emails Sent']].sum()
 
     col1, col2, col3, col4, col5 = st.columns(5)
     with col1:
-        st.metric("Median Response", f"{df_filtered['Median Response (hrs)'].mean():.1f} hrs")
+        st.metric("Median Response", f"{means['Median Response (hrs)']:.1f} hrs")
     with col2:
-        st.metric("Avg Response", f"{df_filtered['Avg Response (hrs)'].mean():.1f} hrs")
+        st.metric("Avg Response", f"{means['Avg Response (hrs)']:.1f} hrs")
     with col3:
-        st.metric("Responses Tracked", f"{int(df_filtered['Responses Tracked'].sum())}")
+        st.metric("Responses Tracked", f"{totals['Responses Tracked']}")
     with col4:
-        st.metric("Emails Received", f"{int(df_filtered['Emails Received'].sum())}")
+        st.metric("Emails Received", f"{totals['Emails Received']}")
     with col5:
-        st.metric("Emails Sent", f"{int(df_filtered['Emails Sent'].sum())}")
+        st.metric("Emails Sent", f"{totals['Emails Sent']}")
 
     st.divider()
 
     # Performance table (sortable)
     st.subheader("Performance Table")
 
-    # Prepare display dataframe
-    df_display = df_filtered[['Name', 'Email', 'Domain', 'Team', 'Median Response (hrs)', 'Avg Response (hrs)', 'Responses Tracked', 'Emails Received', 'Emails Sent']].copy()
-    df_display = df_display.sort_values('Median Response (hrs)')
+    # Prepare display dataframe (column selection + sort already return a new
+    # frame, and nothing mutates it afterwards, so no explicit copy)
+    df_display = df_filtered[['Name', 'Email', 'Domain', 'Team', 'Median Response (hrs)', 'Avg Response (hrs)', 'Responses Tracked', 'Emails Received', 'Emails Sent']].sort_values('Median Response (hrs)')
 
-    # Use st.dataframe with sorting enabled
+    # Use st.dataframe with sorting enabled. Selecting a row drills into
+    # that person, same as picking them in the Individual filter. The key
+    # includes the current filters so a stale selection doesn't carry over.
+    table_key = f"performance_table:{selected_domain}:{selected_team}:{selected_individual}"
+    st.caption("Select a row to view that person's response pairs and received emails.")
     st.dataframe(
         df_display,
         use_container_width=True,
         hide_index=True,
+        key=table_key,
+        on_select=partial(_select_individual_from_table, table_key, df_display['Email'].tolist()),
+        selection_mode="single-row",
         column_config={
             "Name": st.column_config.TextColumn("Name", width="medium"),
             "Email": st.column_config.TextColumn("Email", width="large"),
@@ -1469,249 +2072,253 @@ with tab_dashboard:
         st.divider()
         st.subheader("Response Time Ranking")
 
-        df_sorted = df_filtered.sort_values('Median Response (hrs)')
-
-        fig_ranking = go.Figure()
-
-        colors = ['#00CC96' if x < 4 else '#636EFA' if x < 12 else '#EF553B'
-                  for x in df_sorted['Median Response (hrs)']]
-
-        fig_ranking.add_trace(go.Bar(
-            x=df_sorted['Median Response (hrs)'],
-            y=df_sorted['Name'],
-            orientation='h',
-            marker_color=colors,
-            text=[f"Median: {m:.1f}h | Avg: {a:.1f}h" for m, a in zip(df_sorted['Median Response (hrs)'], df_sorted['Avg Response (hrs)'])],
-            textposition='outside'
-        ))
-
-        fig_ranking.update_layout(
-            xaxis_title='Median Response Time (hours)',
-            yaxis_title='',
-            height=50 + len(df_filtered) * 40,
-            showlegend=False
-        )
+        # df_display is already sorted by median, so reuse it
+        fig_ranking = build_ranking_figure(df_display[['Name', 'Median Response (hrs)', 'Avg Response (hrs)']])
 
-        st.plotly_chart(fig_ranking, use_container_width=True)
+        st.plotly_chart(fig_ranking, use_container_width=True, key="ranking_chart")
 
     # Show response pairs when a single individual is selected
-    if selected_individual != "All Individuals":
+    if is_individual_view:
         st.divider()
 
-        col_header, col_limit = st.columns([3, 1])
-        with col_header:
-            st.subheader("Recent Tracked Response Pairs")
-            st.caption(f"{start_date.strftime('%b %d')} - {end_date.strftime('%b %d, %Y')}")
-        with col_limit:
-            pairs_option = st.selectbox(
-                "Show",
-                options=[10, 25, 50, 100, "All"],
-                index=0,
-                key="num_pairs_selector"
-            )
-            num_pairs = 10000 if pairs_option == "All" else pairs_option
-
-        recent_pairs = get_recent_response_pairs(selected_individual, start_date, end_date, limit=num_pairs, use_adjusted=use_adjusted)
-
-        if not recent_pairs.empty:
-            st.caption(f"Showing {len(recent_pairs)} most recent response pairs")
+        # Fragment: changing "Show" reruns only this section. Exclude/Restore
+        # still call st.rerun(), which reruns the whole app so metrics update.
+        @st.fragment
+        def response_pairs_section(selected_individual, start_date, end_date, use_adjusted, exclude_long_responses):
+            col_header, col_limit = st.columns([3, 1])
+            with col_header:
+                st.subheader("Recent Tracked Response Pairs")
+                st.caption(range_label)
+            with col_limit:
+                # Page size only; older pairs are reached with the keyset
+                # paging below rather than one unbounded "All" request
+                num_pairs = st.selectbox(
+                    "Show",
+                    options=[10, 25, 50, 100, 250],
+                    index=0,
+                    key="num_pairs_selector"
+                )
 
-            # Build display dataframe with Select checkbox
-            display_pairs = recent_pairs[['external_sender', 'subject', 'received_at', 'replied_at', 'response_hours', 'display_hours', 'response_time', 'excluded', 'thread_id', 'raw_replied_at', 'user_email', 'excluded_id', 'whitelisted', 'whitelisted_id', 'body_preview']].copy()
-            display_pairs.insert(0, 'Select', False)
-            display_pairs['Response (hrs)'] = display_pairs['display_hours'].round(1)
+            # Keyset paging: a stack of `before` cursors, one per older page
+            # visited, kept per user + date range so it resets when either changes
+            cursor_key = f"pairs_cursors:{selected_individual}:{start_date}:{end_date}"
+            cursors = st.session_state.setdefault(cursor_key, [])
 
-            # Mark rows as excluded (manual, or >7d unless whitelisted)
-            display_pairs['is_excluded'] = display_pairs.apply(
-                lambda r: r['excluded'] or (exclude_long_responses and r['response_hours'] > 120 and not r['whitelisted']),
-                axis=1
+            recent_pairs = get_recent_response_pairs(
+                selected_individual, start_date, end_date, limit=num_pairs, use_adjusted=use_adjusted,
+                before=cursors[-1] if cursors else None,
             )
 
-            # Excluded column: checkmark for excluded pairs
-            display_pairs['Excluded'] = display_pairs['is_excluded']
-
-            # Rename visible columns
-            display_pairs = display_pairs.rename(columns={
-                'external_sender': 'External Sender',
-                'subject': 'Subject',
-                'received_at': 'Received',
-                'replied_at': 'Replied',
-                'response_time': 'Response Time',
-                'body_preview': 'Email Preview',
-            })
+            if cursors or len(recent_pairs) == num_pairs:
+                nav_col1, nav_col2, _ = st.columns([1, 1, 3])
+                with nav_col1:
+                    st.button("← Newer", key="pairs_newer_btn", disabled=not cursors,
+                              on_click=cursors.pop)
+                with nav_col2:
+                    st.button("Older →", key="pairs_older_btn", disabled=len(recent_pairs) < num_pairs,
+                              on_click=cursors.append,
+                              args=((recent_pairs['raw_replied_at'].iloc[-1], recent_pairs['thread_id'].iloc[-1]) if len(recent_pairs) else None,))
+
+            if not recent_pairs.empty:
+                page_label = f" (page {len(cursors) + 1})" if cursors else ""
+                st.caption(f"Showing {len(recent_pairs)} most recent response pairs{page_label}")
+
+                # Build display dataframe with Select checkbox
+                display_pairs = recent_pairs[['external_sender', 'subject', 'received_at', 'replied_at', 'response_hours', 'display_hours', 'response_time', 'excluded', 'thread_id', 'raw_replied_at', 'user_email', 'excluded_id', 'whitelisted', 'whitelisted_id', 'body_preview']].copy()
+                # Relabel the visible columns in place on the copy (no second frame)
+                display_pairs.columns = [PAIR_DISPLAY_NAMES.get(c, c) for c in display_pairs.columns]
+                display_pairs.insert(0, 'Select', False)
+                display_pairs['Response (hrs)'] = display_pairs['display_hours'].round(1)
+
+                # Mark rows as excluded (manual, or >5d unless whitelisted)
+                display_pairs['is_excluded'] = display_pairs['excluded'].astype(bool) | (
+                    exclude_long_responses
+                    & (display_pairs['response_hours'] > 120)
+                    & ~display_pairs['whitelisted'].astype(bool)
+                )
 
-            edited_df = st.data_editor(
-                display_pairs[['Select', 'Excluded', 'External Sender', 'Subject', 'Received', 'Replied', 'Response (hrs)', 'Response Time', 'Email Preview']],
-                use_container_width=True,
-                hide_index=True,
-                column_config={
-                    "Select": st.column_config.CheckboxColumn("Select", default=False),
-                    "Excluded": st.column_config.CheckboxColumn("Excluded", disabled=True),
-                    "External Sender": st.column_config.TextColumn("External Sender", width="medium"),
-                    "Subject": st.column_config.TextColumn("Subject", width="medium"),
-                    "Received": st.column_config.TextColumn("Received", width="small"),
-                    "Replied": st.column_config.TextColumn("Replied", width="small"),
-                    "Response (hrs)": st.column_config.NumberColumn("Response (hrs)", format="%.1f", width="small"),
-                    "Response Time": st.column_config.TextColumn("Response Time", width="small"),
-                    "Email Preview": st.column_config.TextColumn("Email Preview", width="large"),
-                },
-                disabled=["Excluded", "External Sender", "Subject", "Received", "Replied", "Response (hrs)", "Response Time", "Email Preview"],
-                key="response_pairs_editor",
-            )
+                # Excluded column: checkmark for excluded pairs
+                display_pairs['Excluded'] = display_pairs['is_excluded']
+
+                edited_df = st.data_editor(
+                    display_pairs[['Select', 'Excluded', 'External Sender', 'Subject', 'Received', 'Replied', 'Response (hrs)', 'Response Time', 'Email Preview']],
+                    use_container_width=True,
+                    hide_index=True,
+                    column_config={
+                        "Select": st.column_config.CheckboxColumn("Select", default=False),
+                        "Excluded": st.column_config.CheckboxColumn("Excluded", disabled=True),
+                        "External Sender": st.column_config.TextColumn("External Sender", width="medium"),
+                        "Subject": st.column_config.TextColumn("Subject", width="medium"),
+                        "Received": st.column_config.TextColumn("Received", width="small"),
+                        "Replied": st.column_config.TextColumn("Replied", width="small"),
+                        "Response (hrs)": st.column_config.NumberColumn("Response (hrs)", format="%.1f", width="small"),
+                        "Response Time": st.column_config.TextColumn("Response Time", width="small"),
+                        "Email Preview": st.column_config.TextColumn("Email Preview", width="large"),
+                    },
+                    disabled=["Excluded", "External Sender", "Subject", "Received", "Replied", "Response (hrs)", "Response Time", "Email Preview"],
+                    key="response_pairs_editor",
+                )
 
-            # Buttons for Exclude / Restore
-            btn_col1, btn_col2, _ = st.columns([1, 1, 3])
-            with btn_col1:
-                exclude_clicked = st.button("Exclude Selected", key="exclude_selected_btn")
-            with btn_col2:
-                restore_clicked = st.button("Restore Selected", key="restore_selected_btn")
-
-            if exclude_clicked:
-                selected_indices = edited_df.index[edited_df['Select']].tolist()
-                # Filter to only active (non-excluded) pairs
-                selected_indices = [i for i in selected_indices if not display_pairs.iloc[i]['is_excluded']]
-                if not selected_indices:
-                    st.warning("No active pairs selected to exclude.")
-                else:
-                    try:
-                        affected_dates = set()
-                        for idx in selected_indices:
-                            row = display_pairs.iloc[idx]
-                            pair_data = {
-                                "thread_id": row['thread_id'],
-                                "replied_at": row['raw_replied_at'],
-                                "user_email": row['user_email'],
-                                "external_sender": row['External Sender'],
-                                "subject": row['Subject'],
-                                "response_hours": row['response_hours'],
-                            }
-                            exclude_response_pair(pair_data)
-                            # If this pair was whitelisted, remove the whitelist entry too
-                            if row['whitelisted_id']:
-                                remove_whitelisted_pair(str(row['whitelisted_id']))
-                            replied_dt = pd.to_datetime(row['raw_replied_at'])
-                            affected_dates.add(replied_dt.date().isoformat())
-                        recalculate_daily_stats(selected_individual, list(affected_dates))
-                        _clear_data_caches()
-                        st.rerun()
-                    except Exception as e:
-                        st.error(f"Error excluding pairs: {e}")
-                        st.info("If this is an RLS error, disable Row Level Security on the `excluded_response_pairs` and `whitelisted_response_pairs` tables in Supabase.")
-
-            if restore_clicked:
-                selected_indices = edited_df.index[edited_df['Select']].tolist()
-                # Filter to only excluded pairs (manual or >7d)
-                selected_indices = [i for i in selected_indices if display_pairs.iloc[i]['is_excluded']]
-                if not selected_indices:
-                    st.warning("No excluded pairs selected to restore.")
-                else:
-                    try:
-                        affected_dates = set()
-                        for idx in selected_indices:
-                            row = display_pairs.iloc[idx]
-                            if row['excluded']:
-                                # Manually excluded — remove from excluded table
-                                exc_id = row['excluded_id']
-                                if exc_id:
-                                    restore_response_pair(str(exc_id))
-                            elif exclude_long_responses and row['response_hours'] > 120:
-                                # Excluded by >7d filter — whitelist it
-                                whitelist_response_pair({
+                # Buttons for Exclude / Restore
+                btn_col1, btn_col2, _ = st.columns([1, 1, 3])
+                with btn_col1:
+                    exclude_clicked = st.button("Exclude Selected", key="exclude_selected_btn")
+                with btn_col2:
+                    restore_clicked = st.button("Restore Selected", key="restore_selected_btn")
+
+                # Row selection as one boolean mask over display_pairs (same row order)
+                selected_mask = edited_df['Select'].to_numpy(dtype=bool)
+                excluded_mask = display_pairs['is_excluded'].to_numpy(dtype=bool)
+
+                if exclude_clicked:
+                    # Filter to only active (non-excluded) pairs
+                    selected_pairs = display_pairs[selected_mask & ~excluded_mask]
+                    selected_rows = selected_pairs.to_dict('records')
+                    if not selected_rows:
+                        st.warning("No active pairs selected to exclude.")
+                    else:
+                        try:
+                            # One upsert for every selected pair, plus one delete
+                            # for any of them that were whitelisted
+                            exclude_response_pairs([
+                                {
                                     "thread_id": row['thread_id'],
                                     "replied_at": row['raw_replied_at'],
                                     "user_email": row['user_email'],
-                                })
-                            replied_dt = pd.to_datetime(row['raw_replied_at'])
-                            affected_dates.add(replied_dt.date().isoformat())
-                        recalculate_daily_stats(selected_individual, list(affected_dates))
-                        _clear_data_caches()
-                        st.rerun()
-                    except Exception as e:
-                        st.error(f"Error restoring pairs: {e}")
-                        st.info("If this is an RLS error, disable Row Level Security on the `excluded_response_pairs` and `whitelisted_response_pairs` tables in Supabase.")
-        else:
-            st.info("No response pairs found for this user in this time period.")
+                                    "external_sender": row['External Sender'],
+                                    "subject": row['Subject'],
+                                    "response_hours": row['response_hours'],
+                                }
+                                for row in selected_rows
+                            ])
+                            remove_whitelisted_pairs([str(row['whitelisted_id']) for row in selected_rows if row['whitelisted_id']])
+                            # Reply dates for the whole selection in one conversion
+                            affected_dates = pd.to_datetime(
+                                selected_pairs['raw_replied_at'], utc=True, format="ISO8601"
+                            ).dt.strftime("%Y-%m-%d").unique().tolist()
+                            recalculate_daily_stats(selected_individual, affected_dates)
+                            _clear_data_caches()
+                            st.rerun()
+                        except Exception as e:
+                            st.error(f"Error excluding pairs: {e}")
+                            st.info("If this is an RLS error, disable Row Level Security on the `excluded_response_pairs` and `whitelisted_response_pairs` tables in Supabase.")
+
+                if restore_clicked:
+                    # Filter to only excluded pairs (manual or >7d)
+                    selected_pairs = display_pairs[selected_mask & excluded_mask]
+                    selected_rows = selected_pairs.to_dict('records')
+                    if not selected_rows:
+                        st.warning("No excluded pairs selected to restore.")
+                    else:
+                        try:
+                            restore_ids = []
+                            whitelist_payload = []
+                            for row in selected_rows:
+                                if row['excluded']:
+                                    # Manually excluded — remove from excluded table
+                                    exc_id = row['excluded_id']
+                                    if exc_id:
+                                        restore_ids.append(str(exc_id))
+                                elif exclude_long_responses and row['response_hours'] > 120:
+                                    # Excluded by >7d filter — whitelist it
+                                    whitelist_payload.append({
+                                        "thread_id": row['thread_id'],
+                                        "replied_at": row['raw_replied_at'],
+                                        "user_email": row['user_email'],
+                                    })
+                            # At most one delete and one upsert for the whole selection
+                            restore_response_pairs(restore_ids)
+                            whitelist_response_pairs(whitelist_payload)
+                            # Reply dates for the whole selection in one conversion
+                            affected_dates = pd.to_datetime(
+                                selected_pairs['raw_replied_at'], utc=True, format="ISO8601"
+                            ).dt.strftime("%Y-%m-%d").unique().tolist()
+                            recalculate_daily_stats(selected_individual, affected_dates)
+                            _clear_data_caches()
+                            st.rerun()
+                        except Exception as e:
+                            st.error(f"Error restoring pairs: {e}")
+                            st.info("If this is an RLS error, disable Row Level Security on the `excluded_response_pairs` and `whitelisted_response_pairs` tables in Supabase.")
+            else:
+                st.info("No response pairs found for this user in this time period.")
+
+        response_pairs_section(selected_individual, start_date, end_date, use_adjusted, exclude_long_responses)
 
     # Recent Emails Received section - shows for individual or all
-    if selected_individual != "All Individuals":
+    if is_individual_view:
         st.divider()
 
-        col_recv_header, col_recv_limit = st.columns([3, 1])
-        with col_recv_header:
-            st.subheader("Recent Emails Received")
-            st.caption(f"External emails received by {selected_individual}")
-        with col_recv_limit:
-            num_received = st.selectbox(
-                "Show",
-                options=[10, 25, 50, 100],
-                index=1,
-                key="num_received_selector"
-            )
-
-        st.caption("Excludes: internal emails (same domain), automated messages (newsletters, notifications, noreply, calendar alerts, Stripe, etc.)")
-
-        # Show reply rate stats
-        recv_stats = get_received_emails_stats(selected_individual, start_date, end_date)
-        if recv_stats["total"] > 0:
-            stat_col1, stat_col2, stat_col3 = st.columns(3)
-            with stat_col1:
-                st.metric("External Emails Received", recv_stats["total"])
-            with stat_col2:
-                st.metric("Replied To", recv_stats["replied"])
-            with stat_col3:
-                st.metric("Reply Rate", f"{recv_stats['rate']:.0f}%")
+        @st.fragment
+        def received_emails_section(selected_individual, start_date, end_date):
+            col_recv_header, col_recv_limit = st.columns([3, 1])
+            with col_recv_header:
+                st.subheader("Recent Emails Received")
+                st.caption(f"External emails received by {selected_individual}")
+            with col_recv_limit:
+                num_received = st.selectbox(
+                    "Show",
+                    options=[10, 25, 50, 100],
+                    index=1,
+                    key="num_received_selector"
+                )
 
-        received_df = get_received_emails(selected_individual, start_date, end_date, limit=num_received)
+            st.caption("Excludes: internal emails (same domain), automated messages (newsletters, notifications, noreply, calendar alerts, Stripe, etc.)")
+
+            # The reply-rate counts and the email list are independent reads,
+            # so issue both at once and wait on the slower of the two.
+            executor = get_executor()
+            recv_stats_future = executor.submit(get_received_emails_stats, selected_individual, start_date, end_date)
+            received_future = executor.submit(get_received_emails, selected_individual, start_date, end_date, limit=num_received)
+
+            # Show reply rate stats
+            recv_stats = recv_stats_future.result()
+            if recv_stats["total"] > 0:
+                stat_col1, stat_col2, stat_col3 = st.columns(3)
+                with stat_col1:
+                    st.metric("External Emails Received", recv_stats["total"])
+                with stat_col2:
+                    st.metric("Replied To", recv_stats["replied"])
+                with stat_col3:
+                    st.metric("Reply Rate", f"{recv_stats['rate']:.0f}%")
+
+            received_df = received_future.result()
+
+            if not received_df.empty:
+                # Read-only table: hand st.dataframe an Arrow table built straight
+                # from the columns instead of a copied + relabelled DataFrame
+                display_received = pa.Table.from_pandas(
+                    received_df[['sender_email', 'subject', 'received_at', 'replied', 'response_time', 'body_preview']],
+                    preserve_index=False,
+                ).rename_columns(['From', 'Subject', 'Received', 'Replied', 'Response Time', 'Email Preview'])
+                st.dataframe(
+                    display_received,
+                    use_container_width=True,
+                    hide_index=True,
+                    column_config={
+                        "From": st.column_config.TextColumn("From", width="medium"),
+                        "Subject": st.column_config.TextColumn("Subject", width="medium"),
+                        "Received": st.column_config.TextColumn("Received", width="small"),
+                        "Replied": st.column_config.TextColumn("Replied", width="small"),
+                        "Response Time": st.column_config.TextColumn("Response Time", width="small"),
+                        "Email Preview": st.column_config.TextColumn("Email Preview", width="large"),
+                    }
+                )
+            else:
+                st.info("No received email data yet. Data will appear after the next sync.")
 
-        if not received_df.empty:
-            display_received = received_df[['sender_email', 'subject', 'received_at', 'replied', 'response_time', 'body_preview']].copy()
-            display_received.columns = ['From', 'Subject', 'Received', 'Replied', 'Response Time', 'Email Preview']
-            st.dataframe(
-                display_received,
-                use_container_width=True,
-                hide_index=True,
-                column_config={
-                    "From": st.column_config.TextColumn("From", width="medium"),
-                    "Subject": st.column_config.TextColumn("Subject", width="medium"),
-                    "Received": st.column_config.TextColumn("Received", width="small"),
-                    "Replied": st.column_config.TextColumn("Replied", width="small"),
-                    "Response Time": st.column_config.TextColumn("Response Time", width="small"),
-                    "Email Preview": st.column_config.TextColumn("Email Preview", width="large"),
-                }
-            )
-        else:
-            st.info("No received email data yet. Data will appear after the next sync.")
+        received_emails_section(selected_individual, start_date, end_date)
 
     # Hour-of-day distribution chart (shown for each individual)
-    if selected_individual != "All Individuals":
+    if is_individual_view:
         st.divider()
         st.subheader("Emails Received by Hour of Day")
-        work_settings_for_tz = get_user_work_settings(selected_individual)
+        work_settings_for_tz = work_settings_future.result()
         st.caption(f"All external emails received in the selected date range, grouped by local hour ({work_settings_for_tz.get('timezone', 'America/New_York')})")
 
-        hourly_df = get_hourly_distribution(selected_individual, start_date, end_date)
+        hourly_df = hourly_future.result()
         if not hourly_df.empty:
-            fig_hourly = go.Figure(go.Bar(
-                x=hourly_df["Hour"],
-                y=hourly_df["Emails Received"],
-                text=hourly_df["Emails Received"],
-                textposition="outside",
-                marker_color="#636EFA",
-                hovertemplate="<b>%{customdata}</b><br>%{y} emails<extra></extra>",
-                customdata=hourly_df["Hour Label"],
-            ))
-            fig_hourly.update_layout(
-                xaxis=dict(
-                    tickmode="array",
-                    tickvals=list(range(24)),
-                    ticktext=hourly_df["Hour Label"].tolist(),
-                    title="Hour of Day",
-                ),
-                yaxis_title="Emails Received",
-                showlegend=False,
-                height=350,
-            )
-            st.plotly_chart(fig_hourly, use_container_width=True)
+            fig_hourly = build_hourly_figure(hourly_df)
+            st.plotly_chart(fig_hourly, use_container_width=True, key="hourly_chart")
         else:
             st.info("No received email data available for the selected date range.")
 
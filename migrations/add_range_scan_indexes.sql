@@ -0,0 +1,31 @@
+-- Migration: Indexes for the dashboard's date-range queries
+-- Run this migration in Supabase SQL Editor
+--
+-- Every dashboard read filters on a date/timestamp range, usually together
+-- with user_email. Without these, Postgres sequential-scans the tables and
+-- the queries slow down linearly as history accumulates.
+
+-- daily_stats: the UNIQUE (user_email, date) constraint already covers
+-- per-user lookups; the team-wide range scan (daily_stats_agg and its
+-- client-side fallback) filters on date alone.
+CREATE INDEX IF NOT EXISTS idx_daily_stats_date
+    ON daily_stats (date DESC);
+
+-- response_pairs: per-user tables (newest first) and the team-wide range.
+CREATE INDEX IF NOT EXISTS idx_response_pairs_user_replied
+    ON response_pairs (user_email, replied_at DESC);
+
+CREATE INDEX IF NOT EXISTS idx_response_pairs_replied
+    ON response_pairs (replied_at DESC);
+
+-- received_emails: the individual view's counts, list and hourly chart.
+CREATE INDEX IF NOT EXISTS idx_received_emails_user_received
+    ON received_emails (user_email, received_at DESC);
+
+-- excluded/whitelisted pairs are looked up by replied_at range; their
+-- existing (thread_id, replied_at) index leads with thread_id.
+CREATE INDEX IF NOT EXISTS idx_excluded_response_pairs_replied
+    ON excluded_response_pairs (replied_at);
+
+CREATE INDEX IF NOT EXISTS idx_whitelisted_response_pairs_replied
+    ON whitelisted_response_pairs (replied_at);
@@ -0,0 +1,59 @@
+-- Migration: Server-side per-user totals for the dashboard
+-- Run this migration in Supabase SQL Editor
+--
+-- get_stats_from_supabase (app.py) calls this via supabase.rpc("daily_stats_agg")
+-- so Postgres does the GROUP BY and only one row per user comes back, instead
+-- of one daily_stats row per user per day. Mean/median response times are
+-- still computed from raw response_pairs in app.py, since per-day medians
+-- can't be combined into a true per-user median.
+--
+-- The tracked_users profile columns are joined in here as well, so the
+-- dashboard doesn't need a second request for them. It's a LEFT JOIN: users
+-- with stats but no tracked_users row still come back (with NULL profile
+-- columns, which app.py fills from the email address).
+--
+-- Rows come back ordered by user_email, which the dashboard relies on for the
+-- Individual filter and performance table order.
+--
+-- If this function is missing the dashboard falls back to aggregating
+-- daily_stats client-side.
+
+-- CREATE OR REPLACE can't change a function's return type, so drop any
+-- existing daily_stats_agg first; that way re-running this file always
+-- installs the RETURNS TABLE signature below.
+DROP FUNCTION IF EXISTS daily_stats_agg(date, date);
+
+CREATE OR REPLACE FUNCTION daily_stats_agg(start_date date, end_date date)
+RETURNS TABLE (
+    user_email text,
+    emails_received bigint,
+    emails_sent bigint,
+    response_pairs_count bigint,
+    domain text,
+    display_name text,
+    team_function text
+)
+LANGUAGE sql
+STABLE
+AS $$
+    SELECT
+        totals.user_email,
+        totals.emails_received,
+        totals.emails_sent,
+        totals.response_pairs_count,
+        tu.domain,
+        tu.display_name,
+        tu.team_function
+    FROM (
+        SELECT
+            ds.user_email,
+            COALESCE(SUM(ds.emails_received), 0)::bigint AS emails_received,
+            COALESCE(SUM(ds.emails_sent), 0)::bigint AS emails_sent,
+            COALESCE(SUM(ds.response_pairs_count), 0)::bigint AS response_pairs_count
+        FROM daily_stats ds
+        WHERE ds.date BETWEEN start_date AND end_date
+        GROUP BY ds.user_email
+    ) totals
+    LEFT JOIN tracked_users tu ON tu.email = totals.user_email
+    ORDER BY totals.user_email;
+$$;
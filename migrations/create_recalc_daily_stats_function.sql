@@ -0,0 +1,48 @@
+-- Migration: Server-side recalculation of daily_stats response metrics
+-- Run this migration in Supabase SQL Editor
+--
+-- recalculate_daily_stats (app.py) calls this via supabase.rpc("recalc_daily_stats")
+-- after pairs are excluded or restored, so every affected date is recomputed
+-- in one round-trip instead of a select + excluded lookup + update per date.
+-- Dates are UTC calendar days, matching how the tracker buckets replied_at.
+--
+-- Dates left with no pairs get a count of 0 and NULL metrics. If this
+-- function is missing the dashboard falls back to recomputing each date
+-- client-side.
+
+CREATE OR REPLACE FUNCTION recalc_daily_stats(target_email text, target_dates date[])
+RETURNS void
+LANGUAGE sql
+AS $$
+    UPDATE daily_stats ds
+    SET
+        response_pairs_count = s.pairs_count,
+        avg_response_hours = s.avg_hours,
+        median_response_hours = s.median_hours,
+        min_response_hours = s.min_hours,
+        max_response_hours = s.max_hours,
+        updated_at = now()
+    FROM (
+        SELECT
+            d.day,
+            COUNT(rp.id) AS pairs_count,
+            ROUND(AVG(rp.response_hours)::numeric, 2) AS avg_hours,
+            ROUND((percentile_cont(0.5) WITHIN GROUP (ORDER BY rp.response_hours))::numeric, 2) AS median_hours,
+            ROUND(MIN(rp.response_hours)::numeric, 2) AS min_hours,
+            ROUND(MAX(rp.response_hours)::numeric, 2) AS max_hours
+        FROM unnest(target_dates) AS d(day)
+        LEFT JOIN response_pairs rp
+            ON rp.user_email = target_email
+            AND rp.replied_at >= d.day::timestamp AT TIME ZONE 'UTC'
+            AND rp.replied_at < (d.day + 1)::timestamp AT TIME ZONE 'UTC'
+            AND NOT EXISTS (
+                SELECT 1
+                FROM excluded_response_pairs e
+                WHERE e.thread_id = rp.thread_id
+                  AND e.replied_at = rp.replied_at
+            )
+        GROUP BY d.day
+    ) s
+    WHERE ds.user_email = target_email
+      AND ds.date = s.day;
+$$;
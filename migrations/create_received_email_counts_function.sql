@@ -0,0 +1,24 @@
+-- Migration: Received-email totals for the individual view in one query
+-- Run this migration in Supabase SQL Editor
+--
+-- get_received_emails_stats (app.py) calls this via supabase.rpc("received_email_counts")
+-- to get the total and replied counts for a user's date range in a single
+-- round-trip, instead of two separate count requests. If this function is
+-- missing the dashboard falls back to the two count requests.
+
+CREATE OR REPLACE FUNCTION received_email_counts(target_email text, start_date date, end_date date)
+RETURNS TABLE (
+    total bigint,
+    replied bigint
+)
+LANGUAGE sql
+STABLE
+AS $$
+    SELECT
+        COUNT(*) AS total,
+        COUNT(*) FILTER (WHERE re.replied) AS replied
+    FROM received_emails re
+    WHERE re.user_email = target_email
+      AND re.received_at >= start_date
+      AND re.received_at < end_date + 1;
+$$;
@@ -0,0 +1,42 @@
+-- Migration: Server-side per-user response time stats for the dashboard
+-- Run this migration in Supabase SQL Editor
+--
+-- get_stats_from_supabase (app.py) calls this via supabase.rpc("response_pair_stats")
+-- for raw (not working-hours adjusted) response times, so the exclusion and
+-- whitelist filtering plus the mean/median happen in Postgres and one row per
+-- user comes back, instead of paginating every response_pairs row in the
+-- range and filtering it client-side.
+--
+-- Matches the client-side rules: manually excluded pairs are dropped, and
+-- when exclude_long is set, pairs over 120 hours are dropped unless they've
+-- been whitelisted.
+--
+-- Adjusted hours depend on each user's current OOO periods and work settings,
+-- so that mode is still computed in app.py. If this function is missing the
+-- dashboard falls back to computing raw stats client-side as well.
+
+CREATE OR REPLACE FUNCTION response_pair_stats(start_date date, end_date date, exclude_long boolean)
+RETURNS TABLE (
+    user_email text,
+    avg_response_hours double precision,
+    median_response_hours double precision
+)
+LANGUAGE sql
+STABLE
+AS $$
+    SELECT
+        rp.user_email,
+        AVG(rp.response_hours)::double precision AS avg_response_hours,
+        percentile_cont(0.5) WITHIN GROUP (ORDER BY rp.response_hours) AS median_response_hours
+    FROM response_pairs rp
+    LEFT JOIN excluded_response_pairs e
+        ON e.thread_id = rp.thread_id AND e.replied_at = rp.replied_at
+    LEFT JOIN whitelisted_response_pairs w
+        ON w.thread_id = rp.thread_id AND w.replied_at = rp.replied_at
+    WHERE rp.replied_at >= start_date
+      AND rp.replied_at < end_date + 1
+      AND rp.response_hours IS NOT NULL
+      AND e.thread_id IS NULL
+      AND (NOT exclude_long OR rp.response_hours <= 120 OR w.thread_id IS NOT NULL)
+    GROUP BY rp.user_email;
+$$;
@@ -0,0 +1,21 @@
+-- Migration: response_pairs without manually excluded pairs
+-- Run this migration in Supabase SQL Editor
+--
+-- get_stats_from_supabase (app.py) reads this view when it computes response
+-- times client-side (working-hours adjusted mode, or when response_pair_stats
+-- is missing), so excluded pairs are dropped in Postgres instead of being
+-- downloaded and filtered out in pandas. If this view is missing the
+-- dashboard reads response_pairs and filters exclusions itself.
+--
+-- The >120h filter isn't applied here: in adjusted mode it's checked
+-- against the recalculated hours, which only exist client-side.
+
+CREATE OR REPLACE VIEW response_pairs_included AS
+SELECT rp.*
+FROM response_pairs rp
+WHERE NOT EXISTS (
+    SELECT 1
+    FROM excluded_response_pairs e
+    WHERE e.thread_id = rp.thread_id
+      AND e.replied_at = rp.replied_at
+);
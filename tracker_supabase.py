@@ -180,10 +180,21 @@ def calculate_adjusted_hours(
 # Thread-local storage for Gmail service
 _thread_local = threading.local()
 
+# Shared Supabase client. supabase-py keeps an HTTP connection pool per
+# client, so reusing one instance lets every query in the run reuse the
+# keep-alive connection instead of a fresh TLS handshake per call.
+_supabase_client: Optional[Client] = None
+_supabase_lock = threading.Lock()
+
 
 def get_supabase() -> Client:
-    """Get Supabase client."""
-    return create_client(SUPABASE_URL, SUPABASE_KEY)
+    """Get the shared Supabase client (created on first use)."""
+    global _supabase_client
+    if _supabase_client is None:
+        with _supabase_lock:
+            if _supabase_client is None:
+                _supabase_client = create_client(SUPABASE_URL, SUPABASE_KEY)
+    return _supabase_client
 
 
 def get_gmail_service(user_email: str):